@@ -2,6 +2,15 @@
 Configuration package for Price Sense crawler system.
 """
 
-from .settings import settings
+from typing import Any
 
-__all__ = ["settings"]
\ No newline at end of file
+from .settings import Settings, get_settings
+
+__all__ = ["settings", "Settings", "get_settings"]
+
+
+def __getattr__(name: str) -> Any:
+    """`settings`는 최초 접근 시 생성"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,63 @@
 """
 Configuration settings for Price Sense crawler system.
-"""
 
-from typing import Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+서브 설정(데이터베이스, Redis 등)은 최초 접근 시점에 생성되므로
+실제로 사용하는 서브시스템의 설정만 로드/검증합니다.
+"""
 
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
 
-class DatabaseSettings(BaseSettings):
+from dotenv import dotenv_values
+from pydantic import Field
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict
+)
+
+ENV_FILE = ".env"
+
+
+@lru_cache(maxsize=None)
+def _read_env_file() -> Dict[str, Optional[str]]:
+    """.env 파일을 프로세스당 한 번만 파싱"""
+    return dotenv_values(ENV_FILE)
+
+
+class CachedDotEnvSettingsSource(EnvSettingsSource):
+    """캐시된 .env 값을 환경 변수와 같은 방식으로 제공하는 설정 소스"""
+    
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        env_vars = _read_env_file()
+        if self.case_sensitive:
+            return env_vars
+        return {key.lower(): value for key, value in env_vars.items()}
+
+
+class CachedEnvSettings(BaseSettings):
+    """.env 파싱 결과를 공유하는 설정 기본 클래스"""
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # 우선순위: 초기화 인자 > 환경 변수 > .env > secrets
+        return (
+            init_settings,
+            env_settings,
+            CachedDotEnvSettingsSource(settings_cls),
+            file_secret_settings,
+        )
+
+
+class DatabaseSettings(CachedEnvSettings):
     """데이터베이스 연결 설정"""
     
     url: str = Field(
@@ -19,15 +69,16 @@ class DatabaseSettings(BaseSettings):
     pool_timeout: int = Field(default=30, description="연결 풀 타임아웃 (초)")
     pool_recycle: int = Field(default=3600, description="연결 재사용 주기 (초)")
     echo: bool = Field(default=False, description="SQL 쿼리 로깅 여부")
+    insert_page_size: int = Field(default=1000, description="다중 행 INSERT 한 문장에 묶는 최대 행 수")
+    rollup_refresh_timeout: float = Field(default=0, description="일간 가격 집계 갱신 statement_timeout (초, 0이면 제한 없음)")
 
     model_config = SettingsConfigDict(
         env_prefix="DATABASE_",
-        env_file=".env",
         case_sensitive=False
     )
 
 
-class RedisSettings(BaseSettings):
+class RedisSettings(CachedEnvSettings):
     """Redis 연결 설정"""
     
     url: str = Field(
@@ -44,22 +95,28 @@ class RedisSettings(BaseSettings):
     crawl_queue_name: str = Field(default="pricesense:crawl:queue", description="크롤링 작업 큐 이름")
     result_queue_name: str = Field(default="pricesense:result:queue", description="결과 큐 이름")
     dead_letter_queue: str = Field(default="pricesense:dead:queue", description="실패 작업 큐 이름")
+    failed_save_queue: str = Field(default="pricesense:save:failed", description="DB 저장 실패 행 보관 큐 이름")
     
     model_config = SettingsConfigDict(
         env_prefix="REDIS_",
-        env_file=".env",
         case_sensitive=False
     )
 
 
-class CrawlerSettings(BaseSettings):
+class CrawlerSettings(CachedEnvSettings):
     """크롤링 관련 설정"""
     
     max_workers: int = Field(default=10, description="최대 병렬 크롤링 프로세스 수")
+    task_concurrency: int = Field(default=8, description="워커당 동시 처리 작업 수")
+    driver_pool_size: int = Field(default=4, description="크롤러별 WebDriver 풀 크기")
     request_delay: tuple[int, int] = Field(default=(1, 5), description="요청 간격 (최소, 최대 초)")
     max_retries: int = Field(default=3, description="최대 재시도 횟수")
     retry_delay: int = Field(default=60, description="재시도 지연 시간 (초)")
     timeout: int = Field(default=30, description="HTTP 요청 타임아웃 (초)")
+    shutdown_grace: float = Field(
+        default=60.0,
+        description="종료 시 SIGTERM 후 강제 종료까지의 유예 시간 (초, 페이지 타임아웃 + 결과 전송/저장 재시도 시간 이상)"
+    )
     
     # User-Agent 설정
     user_agent_rotation: bool = Field(default=True, description="User-Agent 로테이션 사용")
@@ -71,12 +128,11 @@ class CrawlerSettings(BaseSettings):
     
     model_config = SettingsConfigDict(
         env_prefix="CRAWLER_",
-        env_file=".env",
         case_sensitive=False
     )
 
 
-class LoggingSettings(BaseSettings):
+class LoggingSettings(CachedEnvSettings):
     """로깅 설정"""
     
     level: str = Field(default="INFO", description="로그 레벨")
@@ -94,12 +150,11 @@ class LoggingSettings(BaseSettings):
     
     model_config = SettingsConfigDict(
         env_prefix="LOG_",
-        env_file=".env",
         case_sensitive=False
     )
 
 
-class SecuritySettings(BaseSettings):
+class SecuritySettings(CachedEnvSettings):
     """보안 관련 설정"""
     
     chrome_driver_path: str = Field(
@@ -117,30 +172,62 @@ class SecuritySettings(BaseSettings):
     
     model_config = SettingsConfigDict(
         env_prefix="SECURITY_",
-        env_file=".env",
         case_sensitive=False
     )
 
 
-class Settings(BaseSettings):
+class Settings(CachedEnvSettings):
     """전체 애플리케이션 설정"""
     
     app_name: str = Field(default="Price Sense Crawler", description="애플리케이션 이름")
     app_version: str = Field(default="1.0.0", description="애플리케이션 버전")
     debug: bool = Field(default=False, description="디버그 모드")
     
-    # 서브 설정들
-    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
-    redis: RedisSettings = Field(default_factory=RedisSettings)
-    crawler: CrawlerSettings = Field(default_factory=CrawlerSettings)
-    logging: LoggingSettings = Field(default_factory=LoggingSettings)
-    security: SecuritySettings = Field(default_factory=SecuritySettings)
-    
     model_config = SettingsConfigDict(
-        env_file=".env",
         case_sensitive=False
     )
+    
+    # 서브 설정들 (최초 접근 시 생성)
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        """데이터베이스 설정"""
+        return DatabaseSettings()
+    
+    @cached_property
+    def redis(self) -> RedisSettings:
+        """Redis 설정"""
+        return RedisSettings()
+    
+    @cached_property
+    def crawler(self) -> CrawlerSettings:
+        """크롤러 설정"""
+        return CrawlerSettings()
+    
+    @cached_property
+    def logging(self) -> LoggingSettings:
+        """로깅 설정"""
+        return LoggingSettings()
+    
+    @cached_property
+    def security(self) -> SecuritySettings:
+        """보안 설정"""
+        return SecuritySettings()
+
+
+# 전역 설정 인스턴스 (최초 접근 시 생성)
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """전역 설정 인스턴스 반환"""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
 
 
-# 전역 설정 인스턴스
-settings = Settings()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """`from config.settings import settings` 지원용 지연 로딩"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,16 +7,18 @@ for web scraping operations.
 """
 
 import asyncio
-import json
+import random
+import re
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from selenium import webdriver
 from selenium.common.exceptions import (
@@ -29,20 +31,96 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from selectolax.lexbor import LexborHTMLParser
 from sqlalchemy.orm import Session
 
+from config.settings import settings
+from crawlers.core.driver_pool import DriverPool
 from models.base import PlatformType, StockStatus
 from models.price_history import PriceHistory
 from models.product import Product
 from models.scrape_logs import ProductScrapeLog
 from models.stock_history import StockHistory
-from storage.connection import SessionLocal
+from storage.connection import bulk_insert, db_manager
+from storage.redis_client import cache_manager, redis_manager, task_queue
+from utils.anti_detection import TokenBucketLimiter
 from utils.logging import get_logger
 
+# 가격 텍스트의 첫 번째 숫자 묶음 (원화는 정수 단위, 소수점 이하는 무시)
+_PRICE_RE = re.compile(r'\d[\d,]*')
+
+
+@lru_cache(maxsize=1)
+def _user_agent_pool() -> Tuple[str, ...]:
+    """User-Agent 데이터셋을 프로세스당 한 번만 로드"""
+    return tuple(browser["useragent"] for browser in UserAgent().data_browsers)
+
+
+@lru_cache(maxsize=4096)
+def _url_host(url: str) -> str:
+    """URL의 소문자 호스트 반환 (스킴/호스트가 없으면 빈 문자열, 같은 URL은 재파싱하지 않음)"""
+    parsed = urlparse(url)
+    if not parsed.scheme:
+        return ""
+    return parsed.hostname or ""
+
+
+@lru_cache(maxsize=256)
+def _confidence_decimal(score: float) -> Decimal:
+    """신뢰도 점수의 DB 저장용 Decimal (소수 둘째 자리로 반올림된 값이라 종류가 적어 캐시)"""
+    return Decimal(str(score))
+
+
+def _to_primitive(value: Any) -> Any:
+    """직렬화 가능한 기본 타입으로 변환"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """나노초 타임스탬프를 ISO 8601 (UTC) 문자열로 변환"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04}-{t.tm_mon:02}-{t.tm_mday:02}"
+        f"T{t.tm_hour:02}:{t.tm_min:02}:{t.tm_sec:02}.{nanos // 1000:06}+00:00"
+    )
+
 
 class CrawlResult:
     """크롤링 결과를 담는 데이터 클래스"""
     
+    # to_dict 키 순서 (scraped_at은 타임스탬프에서 따로 포맷)
+    _FIELDS = (
+        "success",
+        "product_id",
+        "platform",
+        "url",
+        "product_name",
+        "price",
+        "original_price",
+        "discount_rate",
+        "stock_status",
+        "stock_quantity",
+        "promotion_info",
+        "image_url",
+        "category",
+        "brand",
+        "rating",
+        "review_count",
+        "confidence_score",
+        "error_message",
+        "execution_time",
+    )
+    
+    # 인스턴스별 __dict__ 생성 방지
+    __slots__ = _FIELDS + ("scraped_at_ns", "confidence_decimal")
+    
     def __init__(
         self,
         success: bool,
@@ -50,8 +128,8 @@ class CrawlResult:
         platform: PlatformType,
         url: str,
         product_name: Optional[str] = None,
-        price: Optional[Decimal] = None,
-        original_price: Optional[Decimal] = None,
+        price: Optional[int] = None,
+        original_price: Optional[int] = None,
         discount_rate: Optional[float] = None,
         stock_status: StockStatus = StockStatus.UNKNOWN,
         stock_quantity: Optional[int] = None,
@@ -82,39 +160,88 @@ class CrawlResult:
         self.rating = rating
         self.review_count = review_count
         self.confidence_score = confidence_score
+        self.confidence_decimal = _confidence_decimal(confidence_score)  # DB 저장용
         self.error_message = error_message
         self.execution_time = execution_time
-        self.scraped_at = datetime.utcnow()
+        self.scraped_at_ns = time.time_ns()
+    
+    @property
+    def scraped_at(self) -> datetime:
+        """수집 시각 (UTC)"""
+        return datetime.fromtimestamp(self.scraped_at_ns / 1e9, tz=timezone.utc)
     
     def to_dict(self) -> Dict[str, Any]:
         """결과를 딕셔너리로 변환"""
-        return {
-            "success": self.success,
-            "product_id": self.product_id,
-            "platform": self.platform.value,
-            "url": self.url,
-            "product_name": self.product_name,
-            "price": float(self.price) if self.price else None,
-            "original_price": float(self.original_price) if self.original_price else None,
-            "discount_rate": self.discount_rate,
-            "stock_status": self.stock_status.value,
-            "stock_quantity": self.stock_quantity,
-            "promotion_info": self.promotion_info,
-            "image_url": self.image_url,
-            "category": self.category,
-            "brand": self.brand,
-            "rating": self.rating,
-            "review_count": self.review_count,
-            "confidence_score": self.confidence_score,
-            "error_message": self.error_message,
-            "execution_time": self.execution_time,
-            "scraped_at": self.scraped_at.isoformat()
-        }
+        data = {key: _to_primitive(getattr(self, key)) for key in self._FIELDS}
+        data["scraped_at"] = _format_timestamp_ns(self.scraped_at_ns)
+        return data
+
+
+# 저장 대기열 항목: (가격 이력, 재고 이력, 스크래핑 로그) 행과
+# 이력을 기록한 경우 저장 성공 후 갱신할 (중복 체크 키, 가격:재고 상태)
+SaveRows = Tuple[
+    Optional[Dict[str, Any]],
+    Optional[Dict[str, Any]],
+    Dict[str, Any],
+    Optional[Tuple[str, str]]
+]
+
+
+class _LoopShared:
+    """한 이벤트 루프 안의 모든 크롤러가 공유하는 HTTP 클라이언트/속도 제한 상태"""
+    
+    __slots__ = ("client", "users", "lock", "host_limiters")
+    
+    def __init__(self):
+        self.client: Optional[httpx.AsyncClient] = None
+        self.users = 0
+        self.lock = asyncio.Lock()
+        self.host_limiters: Dict[str, TokenBucketLimiter] = {}
 
 
 class BaseCrawler(ABC):
     """모든 플랫폼 크롤러의 기본 클래스"""
     
+    # 인스턴스 하나로 동시에 처리할 수 있는 작업 수 (WebDriver 공유 시 1)
+    max_concurrency: int = 1
+    
+    # DB 일괄 저장 설정 (최대 행 묶음 수, 최대 대기 시간 초, 묶음당 저장 시도 횟수)
+    save_batch_size: int = 100
+    save_flush_interval: float = 0.5
+    save_attempts: int = 2
+    
+    # 호스트별 초당 요청 수와 순간 허용량 (None이면 request_delay 간격으로 제한)
+    requests_per_second: Optional[float] = None
+    rate_burst: float = 1.0
+    
+    # 이벤트 루프별 공유 자원 (HTTP 클라이언트, 호스트별 속도 제한)
+    # asyncio 객체는 생성된 루프에서만 쓸 수 있으므로 루프마다 따로 둔다
+    _loop_shared: Dict[asyncio.AbstractEventLoop, "_LoopShared"] = {}
+    
+    # CDP로 네트워크 단계에서 차단할 리소스 URL 패턴 (이미지/폰트/미디어/분석·광고 추적)
+    _BLOCKED_URL_PATTERNS = (
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*.mp4", "*.webm", "*.mp3",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*facebook.net*", "*wcs.naver.net*",
+    )
+    
+    # 재시도 대기 시간 (초, 시도 순서별)
+    _RETRY_DELAYS = (2, 4, 6, 8, 10)
+    
+    # 재시도할 일시적 오류 (그 외 예외는 즉시 실패)
+    _RETRYABLE_ERRORS = (
+        httpx.HTTPError,
+        asyncio.TimeoutError,
+        TimeoutException,
+        WebDriverException,
+        NoSuchElementException,
+    )
+    
+    # 신뢰도 가중치: 상품명, 가격, 재고 상태, 이미지, 프로모션, 카테고리, 브랜드
+    _CONFIDENCE_WEIGHTS = (0.20, 0.30, 0.20, 0.15, 0.05, 0.05, 0.05)
+    
     def __init__(
         self,
         platform: PlatformType,
@@ -125,20 +252,29 @@ class BaseCrawler(ABC):
         user_agent: Optional[str] = None
     ):
         self.platform = platform
+        self._platform_value = platform.value
         self.headless = headless
         self.request_delay = request_delay
         self.timeout = timeout
         self.max_retries = max_retries
-        self.logger = get_logger(f"crawler.{platform.value}")
+        self.min_confidence = settings.crawler.min_confidence_score
+        self.logger = get_logger(f"crawler.{self._platform_value}")
         
         # User-Agent 설정
-        self.ua = UserAgent()
-        self.user_agent = user_agent or self.ua.random
+        self.user_agent = user_agent or random.choice(_user_agent_pool())
+        self.http_headers = {"User-Agent": self.user_agent}
         
-        # WebDriver 및 HTTP 클라이언트 초기화
-        self.driver: Optional[webdriver.Chrome] = None
+        # 동시 작업용 WebDriver 풀 (드라이버는 필요할 때 생성)
+        self.driver_pool = DriverPool(self._init_webdriver, settings.crawler.driver_pool_size)
         self.http_client: Optional[httpx.AsyncClient] = None
         
+        # 결과 저장 대기열 및 플러시 태스크
+        self._save_queue: Optional[asyncio.Queue] = None
+        self._save_task: Optional[asyncio.Task] = None
+        
+        # 저장 대기 중인 상품별 최신 이력 상태 (Redis 반영 전 같은 상품의 후속 결과 비교용)
+        self._pending_states: Dict[str, str] = {}
+        
         # 성능 메트릭
         self.request_count = 0
         self.error_count = 0
@@ -156,42 +292,101 @@ class BaseCrawler(ABC):
     async def initialize(self):
         """크롤러 초기화"""
         try:
-            # HTTP 클라이언트 초기화
-            self.http_client = httpx.AsyncClient(
-                headers={"User-Agent": self.user_agent},
-                timeout=self.timeout,
-                follow_redirects=True
-            )
+            # 공유 HTTP 클라이언트 획득
+            if self.http_client is None:
+                self.http_client = await self._acquire_shared_client(self.timeout)
             
-            self.logger.info(f"{self.platform.value} crawler initialized")
+            # 결과 일괄 저장 태스크 시작
+            if self._save_task is None:
+                self._save_queue = asyncio.Queue()
+                self._save_task = asyncio.create_task(self._flush_saves())
+            
+            self.logger.info("%s crawler initialized", self._platform_value)
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize crawler: {e}")
+            self.logger.error("Failed to initialize crawler: %s", e)
             raise
     
     async def cleanup(self):
         """리소스 정리"""
         try:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            await self.driver_pool.close()
             
             if self.http_client:
-                await self.http_client.aclose()
                 self.http_client = None
+                await self._release_shared_client()
+            
+            # 대기 중인 결과를 모두 저장한 뒤 플러시 태스크 종료
+            if self._save_task:
+                await self._save_queue.put(None)
+                await self._save_task
+                self._save_task = None
+                self._save_queue = None
             
-            self.logger.info(f"{self.platform.value} crawler cleaned up")
+            self.logger.info("%s crawler cleaned up", self._platform_value)
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
+    
+    @classmethod
+    def _shared_state(cls) -> _LoopShared:
+        """현재 실행 중인 이벤트 루프의 공유 상태 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        shared = BaseCrawler._loop_shared.get(loop)
+        if shared is None:
+            shared = BaseCrawler._loop_shared[loop] = _LoopShared()
+        return shared
+    
+    @classmethod
+    async def _acquire_shared_client(cls, timeout: int) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 참조 획득 (루프별 최초 호출 시 생성)"""
+        while True:
+            shared = cls._shared_state()
+            async with shared.lock:
+                # 대기 중 마지막 사용자가 해제하여 상태가 교체되었으면 다시 시도
+                if BaseCrawler._loop_shared.get(asyncio.get_running_loop()) is not shared:
+                    continue
+                
+                if shared.client is None:
+                    shared.client = httpx.AsyncClient(
+                        http2=True,
+                        timeout=httpx.Timeout(timeout, connect=5.0),
+                        limits=httpx.Limits(
+                            max_keepalive_connections=100,
+                            max_connections=200,
+                            keepalive_expiry=30.0  # 크롤링 간격보다 길게 유지해 TLS 재협상 방지
+                        ),
+                        follow_redirects=True
+                    )
+                shared.users += 1
+                return shared.client
+    
+    @classmethod
+    async def _release_shared_client(cls):
+        """공유 HTTP 클라이언트 참조 해제 (루프의 마지막 사용자가 연결 종료)"""
+        loop = asyncio.get_running_loop()
+        shared = BaseCrawler._loop_shared.get(loop)
+        if shared is None:
+            return
+        
+        async with shared.lock:
+            shared.users -= 1
+            if shared.users <= 0:
+                if BaseCrawler._loop_shared.get(loop) is shared:
+                    del BaseCrawler._loop_shared[loop]
+                if shared.client:
+                    await shared.client.aclose()
     
     def _init_webdriver(self) -> webdriver.Chrome:
         """Selenium WebDriver 초기화"""
         try:
             chrome_options = ChromeOptions()
             
+            # DOM 구성 완료 시점에 제어 반환 (하위 리소스 로딩 대기 안 함)
+            chrome_options.page_load_strategy = "eager"
+            
             if self.headless:
-                chrome_options.add_argument("--headless")
+                chrome_options.add_argument("--headless=new")
             
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
@@ -207,20 +402,87 @@ class BaseCrawler(ABC):
             chrome_options.add_argument("--memory-pressure-off")
             chrome_options.add_argument("--max_old_space_size=4096")
             
+            # 이미지 로딩 및 브라우저 로그 수집 비활성화
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+            chrome_options.set_capability(
+                "goog:loggingPrefs", {"browser": "OFF", "driver": "OFF", "performance": "OFF"}
+            )
+            
             driver = webdriver.Chrome(options=chrome_options)
             driver.set_page_load_timeout(self.timeout)
-            driver.implicitly_wait(10)
+            driver.set_script_timeout(self.timeout + 5)  # 페이지 내 비동기 대기 스크립트용
+            
+            # 이미지/폰트/미디어 요청을 네트워크 단계에서 차단
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(self._BLOCKED_URL_PATTERNS)}
+            )
             
             return driver
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {e}")
+            self.logger.error("Failed to initialize WebDriver: %s", e)
             raise
     
-    async def _delay(self):
-        """요청 간 지연"""
-        if self.request_delay > 0:
-            await asyncio.sleep(self.request_delay)
+    async def _run_with_driver(self, extract: Callable[..., CrawlResult], *args: Any) -> CrawlResult:
+        """풀의 드라이버로 동기 추출 함수를 스레드에서 실행 (스레드 종료 후 반납)"""
+        driver = await self.driver_pool.acquire()
+        work = asyncio.ensure_future(asyncio.to_thread(extract, driver, *args))
+        
+        try:
+            result = await asyncio.shield(work)
+        except asyncio.CancelledError:
+            # 작업이 취소되어도 스레드는 드라이버를 계속 사용 중이므로 끝난 뒤에 반납
+            def _on_done(finished: asyncio.Future):
+                if not finished.cancelled():
+                    finished.exception()  # 취소된 작업의 예외는 로그 없이 회수
+                asyncio.ensure_future(self._return_driver(driver, suspect=True))
+            
+            work.add_done_callback(_on_done)
+            raise
+        except Exception:
+            await self._return_driver(driver, suspect=True)
+            raise
+        
+        await self._return_driver(driver, suspect=not result.success)
+        return result
+    
+    async def _return_driver(self, driver: webdriver.Chrome, suspect: bool):
+        """드라이버 반납 (실패한 작업 뒤에는 상태를 확인해 죽은 드라이버는 폐기)"""
+        broken = suspect and not await asyncio.to_thread(self._driver_alive, driver)
+        await self.driver_pool.release(driver, broken=broken)
+    
+    @staticmethod
+    def _driver_alive(driver: webdriver.Chrome) -> bool:
+        """브라우저 세션 응답 여부 확인 (크래시/세션 만료 시 False)"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _wait_for(self, driver: webdriver.Chrome) -> WebDriverWait:
+        """명시적 대기 헬퍼 (암묵적 대기 대신 필요한 지점에서만 사용)"""
+        return WebDriverWait(driver, self.timeout, poll_frequency=0.2)
+    
+    async def _delay(self, host: str):
+        """호스트별 토큰 버킷으로 요청 속도 제한"""
+        rate = self.requests_per_second
+        if rate is None:
+            if self.request_delay <= 0:
+                return
+            rate = 1 / self.request_delay
+        
+        host_limiters = self._shared_state().host_limiters
+        limiter = host_limiters.get(host)
+        if limiter is None:
+            limiter = host_limiters[host] = TokenBucketLimiter(rate=rate, capacity=self.rate_burst)
+        
+        async with limiter:
+            pass
     
     async def scrape_product(self, product_id: str, url: str) -> CrawlResult:
         """상품 정보 크롤링 메인 메서드"""
@@ -228,31 +490,33 @@ class BaseCrawler(ABC):
         self.request_count += 1
         
         try:
-            self.logger.info(f"Starting scrape for product {product_id}: {url}")
+            self.logger.info("Starting scrape for product %s: %s", product_id, url)
             
-            # URL 유효성 검사
-            if not self._is_valid_url(url):
+            # URL 유효성 검사 (호스트를 한 번만 추출하여 플랫폼 검증/속도 제한에 재사용)
+            host = _url_host(url)
+            if not host:
                 raise ValueError(f"Invalid URL: {url}")
             
             # 플랫폼 URL 검증
-            if not self._is_platform_url(url):
-                raise ValueError(f"URL does not belong to {self.platform.value}: {url}")
+            if not self._is_platform_url(host):
+                raise ValueError(f"URL does not belong to {self._platform_value}: {url}")
             
             # 실제 크롤링 실행
-            result = await self._scrape_with_retry(product_id, url)
+            result = await self._scrape_with_retry(product_id, url, host)
             
             # 실행 시간 기록
             result.execution_time = time.time() - start_time
             
             # 데이터베이스 저장
-            if result.success and result.confidence_score >= 0.7:
+            if result.success and result.confidence_score >= self.min_confidence:
                 await self._save_result(result)
             
             self.logger.info(
-                f"Scrape completed for product {product_id}: "
-                f"success={result.success}, "
-                f"confidence={result.confidence_score:.2f}, "
-                f"time={result.execution_time:.2f}s"
+                "Scrape completed for product %s: success=%s, confidence=%.2f, time=%.2fs",
+                product_id,
+                result.success,
+                result.confidence_score,
+                result.execution_time
             )
             
             return result
@@ -261,37 +525,31 @@ class BaseCrawler(ABC):
             self.error_count += 1
             execution_time = time.time() - start_time
             
-            self.logger.error(f"Scrape failed for product {product_id}: {e}")
+            self.logger.error("Scrape failed for product %s: %s", product_id, e)
             
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message=str(e),
-                execution_time=execution_time
-            )
+            return self._error_result(product_id, url, str(e), execution_time)
     
-    async def _scrape_with_retry(self, product_id: str, url: str) -> CrawlResult:
+    async def _scrape_with_retry(self, product_id: str, url: str, host: str) -> CrawlResult:
         """재시도 로직이 포함된 크롤링"""
         last_exception = None
         
+        last_delay_index = len(self._RETRY_DELAYS) - 1
+        
         for attempt in range(self.max_retries):
             try:
-                await self._delay()
+                await self._delay(host)
                 result = await self.extract_product_data(product_id, url)
                 return result
                 
-            except Exception as e:
+            except self._RETRYABLE_ERRORS as e:
                 last_exception = e
                 self.logger.warning(
-                    f"Scrape attempt {attempt + 1}/{self.max_retries} failed "
-                    f"for product {product_id}: {e}"
+                    "Scrape attempt %d/%d failed for product %s: %s",
+                    attempt + 1, self.max_retries, product_id, e
                 )
                 
                 if attempt < self.max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    await asyncio.sleep(wait_time)
+                    await asyncio.sleep(self._RETRY_DELAYS[min(attempt, last_delay_index)])
         
         raise last_exception
     
@@ -305,8 +563,8 @@ class BaseCrawler(ABC):
         pass
     
     @abstractmethod
-    def _is_platform_url(self, url: str) -> bool:
-        """플랫폼 URL 검증"""
+    def _is_platform_url(self, host: str) -> bool:
+        """플랫폼 URL 검증 (소문자 호스트 기준)"""
         pass
     
     @abstractmethod
@@ -314,104 +572,249 @@ class BaseCrawler(ABC):
         """플랫폼별 CSS 셀렉터 반환"""
         pass
     
-    def _is_valid_url(self, url: str) -> bool:
-        """URL 유효성 검사"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+    @property
+    def selectors(self) -> Dict[str, Tuple[str, ...]]:
+        """플랫폼 셀렉터 (클래스당 한 번만 생성하여 캐시)"""
+        cls = type(self)
+        compiled = cls.__dict__.get("_compiled_selectors")
+        if compiled is None:
+            compiled = {
+                name: (value,) if isinstance(value, str) else tuple(value)
+                for name, value in self.get_platform_selectors().items()
+            }
+            cls._compiled_selectors = compiled
+        return compiled
     
-    def _extract_price(self, price_text: str) -> Optional[Decimal]:
-        """가격 텍스트에서 숫자 추출"""
-        try:
-            import re
-            price_str = re.sub(r'[^\d,.]', '', price_text)
-            price_str = price_str.replace(',', '')
-            return Decimal(price_str)
-        except (ValueError, TypeError):
+    @property
+    def selector_groups(self) -> Dict[str, str]:
+        """필드별 셀렉터를 콤마 그룹으로 합친 셀렉터 (한 번의 탐색으로 매칭)
+        
+        매칭 결과가 문서 순서로 섞이므로 우선순위가 있는 값 필드가 아니라
+        품절 표시/구매 버튼처럼 어느 요소든 신호가 되는 필드에만 사용한다.
+        """
+        cls = type(self)
+        groups = cls.__dict__.get("_selector_groups")
+        if groups is None:
+            groups = {name: ", ".join(values) for name, values in self.selectors.items()}
+            cls._selector_groups = groups
+        return groups
+    
+    def sel(self, name: str) -> Tuple[str, ...]:
+        """이름으로 캐시된 셀렉터 목록 조회"""
+        return self.selectors[name]
+    
+    def _parse_html(self, html: Union[str, bytes]) -> LexborHTMLParser:
+        """HTML 문서를 selectolax(Lexbor) 트리로 파싱"""
+        return LexborHTMLParser(html)
+    
+    def _extract_price(self, price_text: str) -> Optional[int]:
+        """가격 텍스트에서 원 단위 정수 추출"""
+        if not price_text:
+            return None
+        
+        match = _PRICE_RE.search(price_text)
+        if not match:
+            return None
+        return int(match.group().replace(',', ''))
+    
+    def _price_value(self, value: Any) -> Optional[int]:
+        """JSON 가격 값에서 원 단위 정수 추출 (숫자면 정규식 없이 변환)"""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value)
+        if value is None:
             return None
+        return self._extract_price(str(value))
     
     def _calculate_confidence_score(self, data: Dict[str, Any]) -> float:
         """데이터 품질에 따른 신뢰도 점수 계산"""
-        score = 0.0
-        total_checks = 5
+        present = (
+            bool(data.get('product_name')),
+            data.get('price') is not None,
+            data.get('stock_status') != StockStatus.UNKNOWN,
+            bool(data.get('image_url')),
+            bool(data.get('promotion_info')),
+            bool(data.get('category')),
+            bool(data.get('brand'))
+        )
+        score = sum(weight for weight, ok in zip(self._CONFIDENCE_WEIGHTS, present) if ok)
+        return round(score, 2)
+    
+    def _error_result(
+        self,
+        product_id: str,
+        url: str,
+        error_message: str,
+        execution_time: Optional[float] = None
+    ) -> CrawlResult:
+        """실패 결과 생성"""
+        return CrawlResult(
+            success=False,
+            product_id=product_id,
+            platform=self.platform,
+            url=url,
+            error_message=error_message,
+            execution_time=execution_time
+        )
+    
+    async def _save_result(self, result: CrawlResult):
+        """크롤링 결과를 저장 대기열에 추가"""
+        # 직전에 기록한 가격/재고 상태와 같으면 이력 저장 생략 (로그만 저장)
+        key = f"pricesense:dedupe:{result.product_id}"
+        state = f"{result.price}:{result.stock_status.value}"
         
-        # 상품명 존재 여부 (20%)
-        if data.get('product_name'):
-            score += 0.2
+        last_state = self._pending_states.get(key)
+        if last_state is None:
+            last_state = await cache_manager.get_async(key)
         
-        # 가격 정보 존재 여부 (30%)
-        if data.get('price') is not None:
-            score += 0.3
+        is_new = last_state != state
+        if is_new:
+            self._pending_states[key] = state
         
-        # 재고 상태 확인 가능 여부 (20%)
-        if data.get('stock_status') != StockStatus.UNKNOWN:
-            score += 0.2
+        rows = self._build_save_rows(result, include_history=is_new)
+        rows += ((key, state) if is_new else None,)
         
-        # 이미지 URL 존재 여부 (15%)
-        if data.get('image_url'):
-            score += 0.15
+        if self._save_queue is None:
+            # 플러시 태스크가 없으면 즉시 저장
+            await self._write_batch([rows])
+            return
         
-        # 추가 정보 (프로모션, 카테고리 등) 존재 여부 (15%)
-        additional_info = sum([
-            bool(data.get('promotion_info')),
-            bool(data.get('category')),
-            bool(data.get('brand'))
-        ])
-        score += (additional_info / 3) * 0.15
+        await self._save_queue.put(rows)
+    
+    async def _settle_dedupe_states(self, batch: List[SaveRows], saved: bool):
+        """저장 결과에 따라 중복 체크 상태 확정 (성공 시에만 Redis 갱신)"""
+        states = dict(rows[3] for rows in batch if rows[3] is not None)
         
-        return round(score, 2)
+        if saved:
+            await cache_manager.set_many_async(states, settings.crawler.duplicate_check_window)
+        
+        # 이후 더 새로운 상태가 대기열에 들어온 상품은 그대로 유지
+        for key, state in states.items():
+            if self._pending_states.get(key) == state:
+                del self._pending_states[key]
     
-    async def _save_result(self, result: CrawlResult):
-        """크롤링 결과를 데이터베이스에 저장"""
-        session = SessionLocal()
+    def _build_save_rows(
+        self,
+        result: CrawlResult,
+        include_history: bool = True
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Dict[str, Any]]:
+        """크롤링 결과를 테이블별 insert 행으로 변환"""
+        confidence_score = result.confidence_decimal
+        scraped_at = result.scraped_at
         
-        try:
-            # 가격 이력 저장
-            if result.price is not None:
-                price_history = PriceHistory(
-                    product_id=result.product_id,
-                    price=result.price,
-                    original_price=result.original_price,
-                    discount_rate=result.discount_rate,
-                    confidence_score=Decimal(str(result.confidence_score)),
-                    recorded_at=result.scraped_at
-                )
-                session.add(price_history)
-            
-            # 재고 이력 저장
-            stock_history = StockHistory(
-                product_id=result.product_id,
-                stock_status=result.stock_status,
-                stock_quantity=result.stock_quantity,
-                confidence_score=Decimal(str(result.confidence_score)),
-                recorded_at=result.scraped_at
-            )
-            session.add(stock_history)
+        # 가격 이력
+        price_row = None
+        if include_history and result.price is not None:
+            price_row = {
+                "product_id": result.product_id,
+                "price": result.price,
+                "discount_rate": result.discount_rate,
+                "promotion_info": result.promotion_info,
+                "confidence_score": confidence_score,
+                "recorded_at": scraped_at
+            }
+        
+        # 재고 이력
+        stock_row = None
+        if include_history:
+            stock_row = {
+                "product_id": result.product_id,
+                "stock_status": result.stock_status,
+                "stock_quantity": result.stock_quantity,
+                "confidence_score": confidence_score,
+                "recorded_at": scraped_at
+            }
+        
+        # 스크래핑 로그
+        response_time_ms = (
+            int(result.execution_time * 1000)
+            if result.execution_time is not None else None
+        )
+        log_row = {
+            "product_id": result.product_id,
+            "status": "success" if result.success else "failed",
+            "scraped_data": result.to_dict(),  # JSONB 직렬화는 엔진의 orjson serializer가 처리
+            "error_message": result.error_message,
+            "response_time_ms": response_time_ms,
+            "created_at": scraped_at
+        }
+        
+        return price_row, stock_row, log_row
+    
+    async def _flush_saves(self):
+        """저장 대기열을 묶음 단위로 데이터베이스에 기록"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        while not stopping:
+            rows = await self._save_queue.get()
+            if rows is None:
+                break
             
-            # 스크래핑 로그 저장
-            scrape_log = ProductScrapeLog(
-                product_id=result.product_id,
-                platform=result.platform,
-                url=result.url,
-                status="success" if result.success else "failed",
-                execution_time=result.execution_time,
-                confidence_score=Decimal(str(result.confidence_score)),
-                error_message=result.error_message,
-                scraped_data=json.dumps(result.to_dict(), ensure_ascii=False, default=str)
-            )
-            session.add(scrape_log)
+            batch = [rows]
+            deadline = loop.time() + self.save_flush_interval
             
-            session.commit()
-            self.logger.debug(f"Saved crawl result for product {result.product_id}")
+            # 묶음 크기 또는 대기 시간에 도달할 때까지 수집
+            while len(batch) < self.save_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    rows = await asyncio.wait_for(self._save_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if rows is None:
+                    stopping = True
+                    break
+                batch.append(rows)
             
-        except Exception as e:
-            session.rollback()
-            self.logger.error(f"Failed to save crawl result: {e}")
-            raise
-        finally:
-            session.close()
+            await self._write_batch(batch)
+    
+    async def _write_batch(self, batch: List[SaveRows]):
+        """수집된 행을 하나의 트랜잭션으로 저장"""
+        price_rows = [rows[0] for rows in batch if rows[0] is not None]
+        stock_rows = [rows[1] for rows in batch if rows[1] is not None]
+        log_rows = [rows[2] for rows in batch]
+        
+        saved = False
+        error = None
+        for attempt in range(self.save_attempts):
+            try:
+                await asyncio.to_thread(self._insert_rows, price_rows, stock_rows, log_rows)
+                saved = True
+                self.logger.debug("Saved %d crawl results", len(batch))
+                break
+            except Exception as e:
+                error = e
+                self.logger.warning(
+                    "Failed to save %d crawl results (attempt %d/%d): %s",
+                    len(batch), attempt + 1, self.save_attempts, e
+                )
+        
+        if not saved:
+            # 재시도 후에도 실패하면 행을 버리지 않고 Redis 저장 실패 큐에 보관
+            op = task_queue.failed_save_op(
+                {"price_rows": price_rows, "stock_rows": stock_rows, "log_rows": log_rows},
+                str(error)
+            )
+            parked = await task_queue.push_batch_async(redis_manager.get_async_client(), [op])
+            self.logger.error(
+                "Failed to save %d crawl results, %s: %s",
+                len(batch), "moved to failed save queue" if parked else "rows dropped", error
+            )
+        
+        await self._settle_dedupe_states(batch, saved)
+    
+    def _insert_rows(
+        self,
+        price_rows: List[Dict[str, Any]],
+        stock_rows: List[Dict[str, Any]],
+        log_rows: List[Dict[str, Any]]
+    ):
+        """테이블별 다중 행 insert (단일 커밋)"""
+        with db_manager.transaction() as session:
+            bulk_insert(session, PriceHistory.__table__, price_rows)
+            bulk_insert(session, StockHistory.__table__, stock_rows)
+            bulk_insert(session, ProductScrapeLog.__table__, log_rows)
     
     def get_stats(self) -> Dict[str, Any]:
         """크롤러 성능 통계 반환"""
@@ -420,7 +823,7 @@ class BaseCrawler(ABC):
                        if self.request_count > 0 else 0)
         
         return {
-            "platform": self.platform.value,
+            "platform": self._platform_value,
             "runtime": runtime,
             "request_count": self.request_count,
             "error_count": self.error_count,
@@ -0,0 +1,84 @@
+"""
+WebDriver object pool for platform crawlers.
+
+Chrome 인스턴스는 생성 비용이 크므로 크롤러별로 최대 N개까지 만들어 두고
+작업마다 빌려 쓴 뒤 반납합니다. 하나의 드라이버는 동시에 한 작업만 사용합니다.
+"""
+
+import asyncio
+from typing import Callable, List
+
+from selenium import webdriver
+
+from utils.logging import get_logger
+
+
+class DriverPool:
+    """WebDriver 객체 풀"""
+    
+    def __init__(self, factory: Callable[[], webdriver.Chrome], size: int = 4):
+        self.logger = get_logger("driver_pool")
+        self.size = size
+        self._factory = factory
+        # 대여 가능한 슬롯 수 (유휴 드라이버 + 아직 만들지 않았거나 폐기된 자리)
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[webdriver.Chrome] = []
+        self._drivers: List[webdriver.Chrome] = []
+        self._closed = False
+    
+    async def acquire(self) -> webdriver.Chrome:
+        """드라이버 대여 (유휴 드라이버가 없으면 빈 슬롯에 새로 생성)"""
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        
+        try:
+            driver = await asyncio.to_thread(self._factory)
+        except Exception:
+            self._slots.release()
+            raise
+        
+        # 생성 중에 풀이 닫혔으면 새 드라이버도 바로 종료
+        if self._closed:
+            await self._quit(driver)
+            raise RuntimeError("DriverPool is closed")
+        
+        self._drivers.append(driver)
+        return driver
+    
+    async def release(self, driver: webdriver.Chrome, broken: bool = False):
+        """드라이버 반납 (broken이면 종료 후 폐기, 다음 대여 시 새로 생성)"""
+        if self._closed:
+            # close() 이후 늦게 끝난 작업의 드라이버는 풀 상태를 건드리지 않고 종료만 함
+            await self._quit(driver)
+            return
+        
+        try:
+            if broken:
+                self.logger.warning("Discarding broken WebDriver")
+                if driver in self._drivers:
+                    self._drivers.remove(driver)
+                await self._quit(driver)
+            else:
+                self._idle.append(driver)
+        finally:
+            self._slots.release()
+    
+    async def close(self):
+        """모든 드라이버 종료 (이후 대여는 실패하고 반납된 드라이버는 종료만 함)"""
+        self._closed = True
+        drivers, self._drivers = self._drivers, []
+        self._idle.clear()
+        
+        for driver in drivers:
+            await self._quit(driver)
+    
+    async def _quit(self, driver: webdriver.Chrome):
+        """드라이버 종료 (이미 종료된 드라이버의 오류는 로그만 남김)"""
+        try:
+            await asyncio.to_thread(driver.quit)
+        except Exception as e:
+            self.logger.error(f"Error quitting WebDriver: {e}")
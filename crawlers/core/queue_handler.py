@@ -6,48 +6,120 @@ via Redis queues, processing crawling tasks and sending back results.
 """
 
 import asyncio
-import json
 import signal
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, Type
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple, Type
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
+import orjson
+from redis import asyncio as aioredis
+
+from config.settings import settings
 from crawlers.core.base_crawler import BaseCrawler
 from crawlers.platforms.coupang import CoupangCrawler
 from crawlers.platforms.naver_shopping import NaverShoppingCrawler
 from crawlers.platforms.smartstore import SmartStoreCrawler
 from models.base import PlatformType
-from storage.redis_client import task_queue, redis_manager
+from storage.connection import refresh_price_daily_rollup
+from storage.redis_client import REFRESH_PRICE_ROLLUP_TASK, task_queue, redis_manager
 from utils.logging import get_logger
 
 
 class CrawlTask:
     """크롤링 작업을 나타내는 데이터 클래스"""
     
-    def __init__(self, data: Dict[str, Any]):
+    __slots__ = (
+        "task_id",
+        "product_id",
+        "url",
+        "platform",
+        "priority",
+        "retry_count",
+        "user_id",
+        "created_at",
+    )
+    
+    def __init__(self, data: Dict[str, Any], platform: Optional[PlatformType] = None):
+        product_id = data.get('product_id')
+        
         self.task_id = data.get('task_id')
-        self.product_id = str(data.get('product_id'))
+        self.product_id = product_id if isinstance(product_id, str) else str(product_id)
         self.url = data.get('url')
-        self.platform = PlatformType(data.get('platform'))
+        self.platform = platform if platform is not None else PlatformType(data.get('platform'))
         self.priority = data.get('priority', 'normal')
         self.retry_count = data.get('retry_count', 0)
         self.user_id = data.get('user_id')
         self.created_at = data.get('created_at')
-        self.raw_data = data
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """재시도/데드레터 큐 전송용 작업 데이터 재구성"""
+        return {
+            "task_id": self.task_id,
+            "product_id": self.product_id,
+            "url": self.url,
+            "platform": self.platform.value,
+            "priority": self.priority,
+            "retry_count": self.retry_count,
+            "user_id": self.user_id,
+            "created_at": self.created_at
+        }
     
     def __repr__(self):
         return f"CrawlTask(id={self.task_id}, product={self.product_id}, platform={self.platform.value})"
 
 
+@dataclass(slots=True)
+class ResultPayload:
+    """결과 큐로 전송하는 상품 데이터 (orjson이 직접 직렬화)"""
+    
+    product_name: Optional[str]
+    price: Optional[int]
+    original_price: Optional[int]
+    discount_rate: Optional[float]
+    stock_status: str
+    stock_quantity: Optional[int]
+    promotion_info: Optional[str]
+    confidence_score: float
+    image_url: Optional[str]
+    category: Optional[str]
+    brand: Optional[str]
+    rating: Optional[float]
+    review_count: Optional[int]
+
+
 class QueueHandler:
     """Redis 큐 처리 핸들러"""
     
-    def __init__(self):
+    # 한 번의 Redis 왕복으로 가져올 최대 작업 수
+    pop_batch_size = 16
+    
+    # 결과 전송 묶음 설정 (최대 결과 수, 최대 대기 시간 초)
+    result_batch_size = 64
+    result_flush_interval = 0.01
+    
+    def __init__(self, concurrency: Optional[int] = None):
         self.logger = get_logger("queue_handler")
         self.running = False
         self.crawler_instances = {}
         
+        # 공유 비동기 Redis 클라이언트 (start에서 연결)
+        self.redis: Optional[aioredis.Redis] = None
+        
+        # 동시 처리 제어 (전체 동시 작업 수, 플랫폼별 크롤러 동시 사용 수)
+        self.concurrency = concurrency or settings.crawler.task_concurrency
+        self.sem = asyncio.Semaphore(self.concurrency)
+        self._platform_sems: Dict[PlatformType, asyncio.Semaphore] = {}
+        self._init_locks: Dict[PlatformType, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._inflight: Set[asyncio.Task] = set()
+        
+        # 결과 전송 버퍼 및 플러시 태스크
+        self._result_buf: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        
         # 플랫폼별 크롤러 클래스 매핑
         self.crawler_classes: Dict[PlatformType, Type[BaseCrawler]] = {
             PlatformType.COUPANG: CoupangCrawler,
@@ -55,34 +127,126 @@ class QueueHandler:
             PlatformType.SMART_STORE: SmartStoreCrawler,
         }
         
-        # 성능 메트릭
-        self.stats = {
-            'processed_tasks': 0,
-            'successful_tasks': 0,
-            'failed_tasks': 0,
-            'start_time': time.time()
+        # 원본 플랫폼 문자열 -> (플랫폼, 크롤러 클래스) 디스패치 테이블
+        self._platform_dispatch: Dict[str, Tuple[PlatformType, Type[BaseCrawler]]] = {
+            platform.value: (platform, crawler_class)
+            for platform, crawler_class in self.crawler_classes.items()
         }
         
-        # Graceful shutdown을 위한 시그널 핸들러
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # 플랫폼 없이 task_type으로 처리하는 유지보수 작업 (동기 함수, 스레드에서 실행)
+        self._maintenance_dispatch: Dict[str, Callable[[], None]] = {
+            REFRESH_PRICE_ROLLUP_TASK: refresh_price_daily_rollup,
+        }
+        
+        # 성능 메트릭 (단일 이벤트 루프에서만 갱신되므로 일반 정수 카운터 사용)
+        self._processed = 0
+        self._ok = 0
+        self._failed = 0
+        self._start_ns = time.monotonic_ns()  # 경과 시간 계산용 (단조 시계, ns)
+        
+        # Graceful shutdown 이벤트 (start에서 실행 중인 루프에 생성)
+        self._stop: Optional[asyncio.Event] = None
     
-    def _signal_handler(self, signum, frame):
-        """시그널 핸들러 - Graceful shutdown"""
+    def _signal_handler(self, signum: int):
+        """시그널 핸들러 - Graceful shutdown (이벤트 루프에서 호출)"""
         self.logger.info(f"Received signal {signum}, initiating shutdown...")
+        self.stop()
+    
+    def stop(self):
+        """처리 루프 종료 요청 (대기 중인 팝/슬립도 즉시 깨움)"""
         self.running = False
+        if self._stop is not None:
+            self._stop.set()
+    
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop):
+        """SIGINT/SIGTERM을 이벤트 루프에 등록"""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._signal_handler, signum)
+            except (NotImplementedError, RuntimeError):
+                # Windows 등 루프 시그널 핸들러 미지원 환경
+                signal.signal(
+                    signum,
+                    lambda sig, frame: loop.call_soon_threadsafe(self._signal_handler, sig)
+                )
+    
+    def _remove_signal_handlers(self, loop: asyncio.AbstractEventLoop):
+        """등록한 루프 시그널 핸들러 해제"""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(signum)
+            except (NotImplementedError, RuntimeError):
+                pass
+    
+    async def _until_stopped(self, aw):
+        """작업과 종료 이벤트를 경쟁시켜 종료 요청 시 즉시 반환 (종료 시 None)"""
+        pending = asyncio.ensure_future(aw)
+        stop_wait = asyncio.ensure_future(self._stop.wait())
+        try:
+            done, _ = await asyncio.wait((pending, stop_wait), return_when=asyncio.FIRST_COMPLETED)
+            return pending.result() if pending in done else None
+        finally:
+            for fut in (pending, stop_wait):
+                if not fut.done():
+                    fut.cancel()
+    
+    async def _pop_tasks(self) -> List[Dict[str, Any]]:
+        """작업 묶음 가져오기 (종료 요청은 BRPOP 대기만 끊고, 이미 꺼낸 작업은 잃지 않음)"""
+        first = await self._until_stopped(task_queue.brpop_task_async(self.redis, timeout=10))
+        if first is None:
+            return []
+        
+        queue_name, task_json = first
+        task_jsons = [task_json]
+        
+        # 나머지 작업 조회는 취소하지 않음 (응답 도중 취소되면 꺼낸 작업이 사라짐)
+        if self.pop_batch_size > 1:
+            task_jsons.extend(
+                await task_queue.rpop_tasks_async(self.redis, queue_name, self.pop_batch_size - 1)
+            )
+        
+        if self._stop.is_set():
+            # 종료 중에 꺼낸 작업은 처리하지 않고 원래 큐로 되돌림
+            await task_queue.push_batch_async(self.redis, task_queue.requeue_ops(queue_name, task_jsons))
+            self.logger.info(f"Requeued {len(task_jsons)} tasks on shutdown")
+            return []
+        
+        tasks = [orjson.loads(task_json) for task_json in task_jsons]
+        self.logger.debug(f"{len(tasks)} tasks popped from queue: {queue_name}")
+        return tasks
+    
+    async def _sleep_unless_stopped(self, delay: float):
+        """delay초 대기하되 종료 요청 시 즉시 깨어남"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
     
     async def start(self, worker_id: str = "worker-1"):
         """큐 처리 시작"""
         self.running = True
         self.worker_id = worker_id
         
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._install_signal_handlers(loop)
+        
         self.logger.info(f"Queue handler started (worker_id: {worker_id})")
         self.logger.info(f"Supported platforms: {list(self.crawler_classes.keys())}")
         
         try:
+            # 블로킹 작업(Selenium, DB 저장 등)용 스레드 풀 크기 제한
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=self.concurrency + 1, thread_name_prefix="crawler")
+            )
+            
             # Redis 연결 초기화
             redis_manager.initialize()
+            self.redis = redis_manager.get_async_client()
+            
+            # 결과 전송 태스크 시작
+            self._result_buf = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flush_results())
             
             # 메인 처리 루프
             await self._process_loop()
@@ -93,6 +257,7 @@ class QueueHandler:
             self.logger.error(f"Error in queue handler: {e}")
             raise
         finally:
+            self._remove_signal_handlers(loop)
             await self._cleanup()
     
     async def _process_loop(self):
@@ -100,58 +265,80 @@ class QueueHandler:
         consecutive_empty_polls = 0
         max_empty_polls = 6  # 1분간 작업이 없으면 잠시 대기
         
-        while self.running:
+        while not self._stop.is_set():
             try:
-                # 큐에서 작업 가져오기 (10초 블로킹)
-                task_data = task_queue.pop_task(timeout=10)
+                # 큐에서 작업 묶음 가져오기 (첫 작업까지 최대 10초 대기, 종료 요청 시 즉시 중단)
+                tasks = await self._pop_tasks()
                 
-                if task_data:
+                if tasks:
                     consecutive_empty_polls = 0
-                    await self._process_task(task_data)
+                    
+                    # 동시 처리 슬롯이 날 때마다 작업 시작
+                    for task_data in tasks:
+                        await self.sem.acquire()
+                        running = asyncio.create_task(self._run_with_sem(task_data))
+                        self._inflight.add(running)
+                        running.add_done_callback(self._inflight.discard)
                 else:
                     consecutive_empty_polls += 1
                     
                     # 연속으로 빈 큐를 여러 번 확인하면 잠시 대기
                     if consecutive_empty_polls >= max_empty_polls:
                         self.logger.debug("No tasks for a while, sleeping...")
-                        await asyncio.sleep(10)
+                        await self._sleep_unless_stopped(10)
                         consecutive_empty_polls = 0
                 
             except Exception as e:
                 self.logger.error(f"Error in process loop: {e}")
-                await asyncio.sleep(5)  # 에러 발생시 잠시 대기
+                await self._sleep_unless_stopped(5)  # 에러 발생시 잠시 대기
         
         self.logger.info("Process loop ended")
     
+    async def _run_with_sem(self, task_data: Dict[str, Any]):
+        """작업 처리 후 동시 처리 슬롯 반환"""
+        try:
+            await self._process_task(task_data)
+        finally:
+            self.sem.release()
+    
     async def _process_task(self, task_data: Dict[str, Any]):
         """개별 작업 처리"""
         task = None
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
+            # 플랫폼별 크롤러 선택 (원본 문자열로 한 번에 조회)
+            dispatch = self._platform_dispatch.get(task_data.get('platform'))
+            if dispatch is None:
+                # 플랫폼이 없는 유지보수 작업
+                maintenance = self._maintenance_dispatch.get(task_data.get('task_type'))
+                if maintenance is None:
+                    raise ValueError(f"Unsupported platform: {task_data.get('platform')}")
+                if await self._run_maintenance(task_data, maintenance):
+                    self._ok += 1
+                else:
+                    self._failed += 1
+                return
+            platform, crawler_class = dispatch
+            
             # 작업 객체 생성
-            task = CrawlTask(task_data)
+            task = CrawlTask(task_data, platform)
             self.logger.info(f"Processing task: {task}")
             
-            # 플랫폼별 크롤러 선택
-            crawler_class = self.crawler_classes.get(task.platform)
-            if not crawler_class:
-                raise ValueError(f"Unsupported platform: {task.platform.value}")
-            
             # 크롤러 인스턴스 가져오기 또는 생성
             crawler = await self._get_crawler_instance(task.platform, crawler_class)
             
-            # 크롤링 실행
-            result = await crawler.scrape_product(task.product_id, task.url)
+            # 크롤링 실행 (크롤러가 허용하는 동시 사용 수만큼만)
+            async with self._platform_sems[task.platform]:
+                result = await crawler.scrape_product(task.product_id, task.url)
             
             # 결과 처리
-            await self._handle_result(task, result, time.time() - start_time)
+            await self._handle_result(task, result, (time.monotonic_ns() - start_ns) // 1_000_000)
             
-            self.stats['processed_tasks'] += 1
             if result.success:
-                self.stats['successful_tasks'] += 1
+                self._ok += 1
             else:
-                self.stats['failed_tasks'] += 1
+                self._failed += 1
                 
         except Exception as e:
             self.logger.error(f"Error processing task {task}: {e}")
@@ -159,31 +346,60 @@ class QueueHandler:
             if task:
                 # 실패한 작업 처리
                 await self._handle_task_failure(task, str(e))
-                self.stats['failed_tasks'] += 1
+                self._failed += 1
+        finally:
+            self._processed += 1
+    
+    async def _run_maintenance(self, task_data: Dict[str, Any], maintenance: Callable[[], None]) -> bool:
+        """유지보수 작업 실행 (실패 시 크롤링 작업과 같은 재시도/데드레터 경로로 이동)"""
+        task_id = task_data.get('task_id')
+        
+        try:
+            await asyncio.to_thread(maintenance)
+        except Exception as e:
+            self.logger.error(f"Maintenance task {task_id} failed: {e}")
             
-            self.stats['processed_tasks'] += 1
+            try:
+                success = await task_queue.push_batch_async(self.redis, [
+                    task_queue.failed_task_op(dict(task_data), str(e))
+                ])
+                if not success:
+                    self.logger.error(f"Failed to handle task failure for {task_id}")
+            except Exception as push_error:
+                self.logger.error(f"Error in task failure handler: {push_error}")
+            return False
+        
+        self.logger.info(f"Maintenance task completed: {task_id}")
+        return True
     
     async def _get_crawler_instance(self, platform: PlatformType, crawler_class: Type[BaseCrawler]) -> BaseCrawler:
         """크롤러 인스턴스 관리 (재사용을 위해 캐시)"""
         
-        if platform not in self.crawler_instances:
-            # 새 크롤러 인스턴스 생성
-            crawler = crawler_class(
-                headless=True,
-                request_delay=2.0,
-                timeout=30,
-                max_retries=2  # 큐 레벨에서도 재시도하므로 크롤러 레벨은 줄임
-            )
-            
-            # 비동기 초기화
-            await crawler.initialize()
-            
-            self.crawler_instances[platform] = crawler
-            self.logger.info(f"Created new crawler instance for {platform.value}")
+        crawler = self.crawler_instances.get(platform)
+        if crawler is not None:
+            return crawler
+        
+        # 동시 캐시 미스를 한 번의 초기화로 합침 (중복 드라이버 생성 방지)
+        async with self._init_locks[platform]:
+            if platform not in self.crawler_instances:
+                # 새 크롤러 인스턴스 생성
+                crawler = crawler_class(
+                    headless=True,
+                    request_delay=2.0,
+                    timeout=30,
+                    max_retries=2  # 큐 레벨에서도 재시도하므로 크롤러 레벨은 줄임
+                )
+                
+                # 비동기 초기화
+                await crawler.initialize()
+                
+                self._platform_sems[platform] = asyncio.Semaphore(crawler.max_concurrency)
+                self.crawler_instances[platform] = crawler
+                self.logger.info(f"Created new crawler instance for {platform.value}")
         
         return self.crawler_instances[platform]
     
-    async def _handle_result(self, task: CrawlTask, result, execution_time: float):
+    async def _handle_result(self, task: CrawlTask, result, execution_time_ms: int):
         """크롤링 결과 처리"""
         
         try:
@@ -192,32 +408,29 @@ class QueueHandler:
                 result_data = {
                     "task_id": task.task_id,
                     "status": "success",
-                    "data": {
-                        "product_name": result.product_name,
-                        "price": float(result.price) if result.price else None,
-                        "original_price": float(result.original_price) if result.original_price else None,
-                        "discount_rate": result.discount_rate,
-                        "stock_status": result.stock_status.value,
-                        "stock_quantity": result.stock_quantity,
-                        "promotion_info": result.promotion_info,
-                        "confidence_score": result.confidence_score,
-                        "image_url": result.image_url,
-                        "category": result.category,
-                        "brand": result.brand,
-                        "rating": result.rating,
-                        "review_count": result.review_count
-                    },
-                    "execution_time": int(execution_time * 1000),  # 밀리초로 변환
+                    "data": ResultPayload(
+                        result.product_name,
+                        result.price,
+                        result.original_price,
+                        result.discount_rate,
+                        result.stock_status.value,
+                        result.stock_quantity,
+                        result.promotion_info,
+                        result.confidence_score,
+                        result.image_url,
+                        result.category,
+                        result.brand,
+                        result.rating,
+                        result.review_count
+                    ),
+                    "execution_time": execution_time_ms,  # 밀리초
                     "worker_id": self.worker_id,
                     "platform": task.platform.value
                 }
                 
-                success = task_queue.push_result(result_data)
-                
-                if success:
-                    self.logger.info(f"Task {task.task_id} completed successfully")
-                else:
-                    self.logger.error(f"Failed to send result for task {task.task_id}")
+                # 버퍼에 추가하고 전송은 플러시 태스크가 묶어서 처리
+                await self._result_buf.put(result_data)
+                self.logger.info(f"Task {task.task_id} completed successfully")
                     
             else:
                 # 실패한 작업 처리
@@ -231,17 +444,6 @@ class QueueHandler:
         """실패한 작업 처리"""
         
         try:
-            # 재시도하거나 데드레터 큐로 이동
-            success = task_queue.push_failed_task(task.raw_data, error_message)
-            
-            if success:
-                if task.retry_count < 3:  # 설정에서 가져와야 함
-                    self.logger.warning(f"Task {task.task_id} failed, will retry (attempt {task.retry_count + 1})")
-                else:
-                    self.logger.error(f"Task {task.task_id} permanently failed: {error_message}")
-            else:
-                self.logger.error(f"Failed to handle task failure for {task.task_id}")
-            
             # 실패 결과도 결과 큐에 전송
             failure_result = {
                 "task_id": task.task_id,
@@ -253,16 +455,66 @@ class QueueHandler:
                 "platform": task.platform.value
             }
             
-            task_queue.push_result(failure_result)
+            # 재시도/데드레터 이동과 실패 결과 전송을 한 번의 파이프라인으로 처리
+            success = await task_queue.push_batch_async(self.redis, [
+                task_queue.failed_task_op(task.to_dict(), error_message),
+                task_queue.result_op(failure_result)
+            ])
+            
+            if success:
+                if task.retry_count < 3:  # 설정에서 가져와야 함
+                    self.logger.warning(f"Task {task.task_id} failed, will retry (attempt {task.retry_count + 1})")
+                else:
+                    self.logger.error(f"Task {task.task_id} permanently failed: {error_message}")
+            else:
+                self.logger.error(f"Failed to handle task failure for {task.task_id}")
             
         except Exception as e:
             self.logger.error(f"Error in task failure handler: {e}")
     
+    async def _flush_results(self):
+        """결과 버퍼를 묶음 단위로 결과 큐에 전송"""
+        stopping = False
+        
+        while not stopping:
+            result_data = await self._result_buf.get()
+            if result_data is None:
+                break
+            
+            batch = [result_data]
+            
+            # 묶음 크기에 도달하거나 잠시 새 결과가 없을 때까지 수집
+            while len(batch) < self.result_batch_size:
+                try:
+                    result_data = await asyncio.wait_for(
+                        self._result_buf.get(), timeout=self.result_flush_interval
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if result_data is None:
+                    stopping = True
+                    break
+                batch.append(result_data)
+            
+            if not await task_queue.push_results_async(self.redis, batch):
+                task_ids = [item.get("task_id") for item in batch]
+                self.logger.error(f"Failed to send results for tasks {task_ids}")
+    
     async def _cleanup(self):
         """리소스 정리"""
         self.logger.info("Starting cleanup...")
         
         try:
+            # 진행 중인 작업 완료 대기
+            if self._inflight:
+                await asyncio.gather(*self._inflight, return_exceptions=True)
+            
+            # 남은 결과를 모두 전송한 뒤 플러시 태스크 종료
+            if self._flusher_task:
+                await self._result_buf.put(None)
+                await self._flusher_task
+                self._flusher_task = None
+            
             # 모든 크롤러 인스턴스 정리
             for platform, crawler in self.crawler_instances.items():
                 try:
@@ -274,6 +526,8 @@ class QueueHandler:
             self.crawler_instances.clear()
             
             # Redis 연결 정리
+            await redis_manager.aclose()
+            self.redis = None
             redis_manager.close()
             
             # 통계 출력
@@ -286,37 +540,49 @@ class QueueHandler:
     
     def _log_final_stats(self):
         """최종 통계 로깅"""
-        runtime = time.time() - self.stats['start_time']
+        runtime = (time.monotonic_ns() - self._start_ns) / 1e9
         
         self.logger.info("=== Final Statistics ===")
         self.logger.info(f"Runtime: {runtime:.1f} seconds")
-        self.logger.info(f"Total tasks processed: {self.stats['processed_tasks']}")
-        self.logger.info(f"Successful tasks: {self.stats['successful_tasks']}")
-        self.logger.info(f"Failed tasks: {self.stats['failed_tasks']}")
+        self.logger.info(f"Total tasks processed: {self._processed}")
+        self.logger.info(f"Successful tasks: {self._ok}")
+        self.logger.info(f"Failed tasks: {self._failed}")
         
-        if self.stats['processed_tasks'] > 0:
-            success_rate = (self.stats['successful_tasks'] / self.stats['processed_tasks']) * 100
-            avg_time = runtime / self.stats['processed_tasks']
+        if self._processed > 0:
+            success_rate = (self._ok / self._processed) * 100
+            avg_time = runtime / self._processed
             self.logger.info(f"Success rate: {success_rate:.1f}%")
             self.logger.info(f"Average time per task: {avg_time:.1f} seconds")
     
     def get_stats(self) -> Dict[str, Any]:
         """현재 통계 반환"""
-        runtime = time.time() - self.stats['start_time']
+        runtime = (time.monotonic_ns() - self._start_ns) / 1e9
         
         return {
-            **self.stats,
+            'processed_tasks': self._processed,
+            'successful_tasks': self._ok,
+            'failed_tasks': self._failed,
+            'start_time': self._start_ns,
             'runtime': runtime,
-            'success_rate': (self.stats['successful_tasks'] / max(1, self.stats['processed_tasks'])) * 100,
+            'success_rate': (self._ok / max(1, self._processed)) * 100,
             'worker_id': self.worker_id,
             'running': self.running
         }
 
 
 # 편의 함수
-async def run_queue_handler(worker_id: str = "worker-1"):
+def run_event_loop(coro):
+    """코루틴 실행 (uvloop 사용 가능 시 libuv 기반 이벤트 루프로 실행)"""
+    try:
+        import uvloop
+    except ImportError:  # Windows 등 uvloop 미지원 환경
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+async def run_queue_handler(worker_id: str = "worker-1", concurrency: Optional[int] = None):
     """큐 핸들러 실행"""
-    handler = QueueHandler()
+    handler = QueueHandler(concurrency)
     await handler.start(worker_id)
 
 
@@ -327,7 +593,7 @@ if __name__ == "__main__":
     worker_id = sys.argv[1] if len(sys.argv) > 1 else "worker-1"
     
     try:
-        asyncio.run(run_queue_handler(worker_id))
+        run_event_loop(run_queue_handler(worker_id))
     except KeyboardInterrupt:
         print("\nShutdown complete")
     except Exception as e:
@@ -6,19 +6,115 @@ one of Korea's largest e-commerce platforms.
 """
 
 import re
-from decimal import Decimal
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from typing import Any, Dict, Optional, Tuple
 
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 
 from crawlers.core.base_crawler import BaseCrawler, CrawlResult
 from models.base import PlatformType, StockStatus
 
 
+# 할인율/평점 숫자 추출 패턴
+_DISCOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# 쿠팡 플랫폼 CSS 셀렉터 (필드별 우선순위 순)
+_SELECTORS: Dict[str, Tuple[str, ...]] = {
+    # 상품명
+    'product_name': (
+        '.prod-buy-header__title',
+        '.product-title h2',
+        '.prod-buy-header .title'
+    ),
+    
+    # 현재 가격
+    'current_price': (
+        '.total-price strong.price-value',
+        '.price .total-price .price-value', 
+        '.prod-price .total-price .price-value',
+        '.price-wrap .total-price'
+    ),
+    
+    # 원래 가격 (할인 전)
+    'original_price': (
+        '.origin-price .price-value',
+        '.prod-origin-price .price-value',
+        '.price-wrap .origin-price'
+    ),
+    
+    # 할인율
+    'discount_rate': (
+        '.discount-percentage',
+        '.prod-coupon-price .discount-percentage'
+    ),
+    
+    # 재고 상태
+    'stock_status': (
+        '.prod-option-inventory',
+        '.inventory-notice', 
+        '.out-of-stock',
+        '.stock-info'
+    ),
+    
+    # 배송/프로모션 정보
+    'promotion': (
+        '.badge.rocket',
+        '.prod-shipping-fee-and-pdd-arrival-info',
+        '.shipping-fee-info',
+        '.badge-list .badge'
+    ),
+    
+    # 상품 이미지
+    'image': (
+        '.prod-image__detail img',
+        '.prod-image-container img',
+        '.product-image img'
+    ),
+    
+    # 카테고리
+    'category': (
+        '.prod-navigation__list',
+        '.breadcrumb-list'
+    ),
+    
+    # 브랜드
+    'brand': (
+        '.prod-sale-vendor-name',
+        '.brand-name'
+    ),
+    
+    # 평점
+    'rating': (
+        '.rating-star-num',
+        '.prod-review-average-rating'
+    )
+}
+
+# 재고 안내 문구 키워드 → 재고 상태
+_STOCK_KEYWORDS: Dict[str, StockStatus] = {
+    '품절': StockStatus.OUT_OF_STOCK,
+    'out of stock': StockStatus.OUT_OF_STOCK,
+    '수량한정': StockStatus.LIMITED,
+    '한정': StockStatus.LIMITED,
+    '재고부족': StockStatus.CRITICAL,
+    '재고 부족': StockStatus.CRITICAL,
+}
+_STOCK_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in _STOCK_KEYWORDS))
+
+# 여러 키워드가 함께 있을 때의 판별 우선순위
+_STOCK_KEYWORD_PRIORITY = (StockStatus.OUT_OF_STOCK, StockStatus.LIMITED, StockStatus.CRITICAL)
+
+# 재고 상태 판별용 셀렉터
+_OUT_OF_STOCK_SELECTOR = '.out-of-stock, .sold-out, .temporary-out-of-stock'
+_QUANTITY_SELECTOR = '.prod-option-inventory, .quantity-info'
+_BUY_BUTTON_SELECTOR = '.prod-buy-btn, .buy-button'
+
+
 class CoupangCrawler(BaseCrawler):
     """쿠팡 전용 크롤러"""
     
@@ -28,276 +124,198 @@ class CoupangCrawler(BaseCrawler):
         # 쿠팡 특화 설정
         self.request_delay = 3.0  # 쿠팡은 좀 더 긴 지연
         
-    def _is_platform_url(self, url: str) -> bool:
+        # WebDriver 풀 크기만큼 동시 작업 허용
+        self.max_concurrency = self.driver_pool.size
+        
+    def _is_platform_url(self, host: str) -> bool:
         """쿠팡 URL인지 확인"""
-        try:
-            parsed = urlparse(url)
-            return 'coupang.com' in parsed.netloc.lower()
-        except Exception:
-            return False
+        return host == 'coupang.com' or host.endswith('.coupang.com')
     
-    def get_platform_selectors(self) -> Dict[str, str]:
+    def get_platform_selectors(self) -> Dict[str, Tuple[str, ...]]:
         """쿠팡 플랫폼 CSS 셀렉터"""
-        return {
-            # 상품명
-            'product_name': [
-                '.prod-buy-header__title',
-                '.product-title h2',
-                '.prod-buy-header .title'
-            ],
-            
-            # 현재 가격
-            'current_price': [
-                '.total-price strong.price-value',
-                '.price .total-price .price-value', 
-                '.prod-price .total-price .price-value',
-                '.price-wrap .total-price'
-            ],
-            
-            # 원래 가격 (할인 전)
-            'original_price': [
-                '.origin-price .price-value',
-                '.prod-origin-price .price-value',
-                '.price-wrap .origin-price'
-            ],
-            
-            # 할인율
-            'discount_rate': [
-                '.discount-percentage',
-                '.prod-coupon-price .discount-percentage'
-            ],
-            
-            # 재고 상태
-            'stock_status': [
-                '.prod-option-inventory',
-                '.inventory-notice', 
-                '.out-of-stock',
-                '.stock-info'
-            ],
-            
-            # 배송/프로모션 정보
-            'promotion': [
-                '.badge.rocket',
-                '.prod-shipping-fee-and-pdd-arrival-info',
-                '.shipping-fee-info',
-                '.badge-list .badge'
-            ],
-            
-            # 상품 이미지
-            'image': [
-                '.prod-image__detail img',
-                '.prod-image-container img',
-                '.product-image img'
-            ],
-            
-            # 카테고리
-            'category': [
-                '.prod-navigation__list',
-                '.breadcrumb-list'
-            ],
-            
-            # 브랜드
-            'brand': [
-                '.prod-sale-vendor-name',
-                '.brand-name'
-            ],
-            
-            # 평점
-            'rating': [
-                '.rating-star-num',
-                '.prod-review-average-rating'
-            ]
-        }
+        return _SELECTORS
     
     async def extract_product_data(self, product_id: str, url: str) -> CrawlResult:
         """쿠팡 상품 데이터 추출"""
-        if not self.driver:
-            self.driver = self._init_webdriver()
+        # 먼저 HTTP 요청 + HTML 파서로 시도 (브라우저 없이, 더 빠름)
+        try:
+            data = await self._extract_with_http(url)
+            if data.get('product_name') and data.get('price') is not None:
+                return self._build_result(product_id, url, data)
+            self.logger.info(f"HTTP 응답에 핵심 정보 없음, Selenium으로 시도: {url}")
+        except httpx.HTTPError as e:
+            self.logger.info(f"HTTP 추출 실패, Selenium으로 시도: {e}")
         
+        # 핵심 필드가 비어 있으면 Selenium 사용
+        return await self._extract_with_selenium(product_id, url)
+    
+    async def _extract_with_http(self, url: str) -> Dict[str, Any]:
+        """HTTP 요청을 통한 데이터 추출"""
+        if not self.http_client:
+            await self.initialize()
+        
+        response = await self.http_client.get(url, headers=self.http_headers)
+        response.raise_for_status()
+        
+        return self._extract_from_html(self._parse_html(response.content))
+    
+    def _build_result(self, product_id: str, url: str, data: Dict[str, Any]) -> CrawlResult:
+        """추출된 데이터로 크롤링 결과 생성"""
+        # 신뢰도 점수 계산
+        confidence_score = self._calculate_confidence_score(data)
+        
+        return CrawlResult(
+            success=True,
+            product_id=product_id,
+            platform=self.platform,
+            url=url,
+            product_name=data.get('product_name'),
+            price=data.get('price'),
+            original_price=data.get('original_price'),
+            discount_rate=data.get('discount_rate'),
+            stock_status=data.get('stock_status', StockStatus.UNKNOWN),
+            promotion_info=data.get('promotion_info'),
+            image_url=data.get('image_url'),
+            category=data.get('category'),
+            brand=data.get('brand'),
+            rating=data.get('rating'),
+            confidence_score=confidence_score
+        )
+    
+    async def _extract_with_selenium(self, product_id: str, url: str) -> CrawlResult:
+        """Selenium을 통한 데이터 추출 (블로킹 호출은 스레드 풀에서 실행)"""
+        return await self._run_with_driver(self._sync_extract_with_selenium, product_id, url)
+    
+    def _sync_extract_with_selenium(self, driver: webdriver.Chrome, product_id: str, url: str) -> CrawlResult:
+        """Selenium 페이지 로드 및 추출 (동기)"""
         try:
             # 페이지 로드
-            self.driver.get(url)
+            driver.get(url)
             
             # 페이지 로드 완료 대기
-            WebDriverWait(self.driver, self.timeout).until(
+            self._wait_for(driver).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "prod-buy-header"))
             )
             
-            # 데이터 추출
-            data = {}
-            selectors = self.get_platform_selectors()
-            
-            # 상품명 추출
-            data['product_name'] = self._extract_text_by_selectors(selectors['product_name'])
-            
-            # 가격 정보 추출
-            current_price_text = self._extract_text_by_selectors(selectors['current_price'])
-            data['price'] = self._extract_price(current_price_text) if current_price_text else None
+            # 렌더링된 DOM을 한 번에 가져와 로컬에서 파싱 (요소별 WebDriver 왕복 제거)
+            tree = self._parse_html(driver.page_source)
+            data = self._extract_from_html(tree)
             
-            original_price_text = self._extract_text_by_selectors(selectors['original_price'])
-            data['original_price'] = self._extract_price(original_price_text) if original_price_text else None
-            
-            # 할인율 추출
-            discount_text = self._extract_text_by_selectors(selectors['discount_rate'])
-            data['discount_rate'] = self._extract_discount_rate(discount_text) if discount_text else None
-            
-            # 재고 상태 추출
-            data['stock_status'] = self._extract_stock_status()
-            
-            # 프로모션 정보 추출
-            data['promotion_info'] = self._extract_promotion_info(selectors['promotion'])
-            
-            # 이미지 URL 추출
-            data['image_url'] = self._extract_image_url(selectors['image'])
-            
-            # 카테고리 추출
-            data['category'] = self._extract_text_by_selectors(selectors['category'])
-            
-            # 브랜드 추출
-            data['brand'] = self._extract_text_by_selectors(selectors['brand'])
-            
-            # 평점 추출
-            rating_text = self._extract_text_by_selectors(selectors['rating'])
-            data['rating'] = self._extract_rating(rating_text) if rating_text else None
-            
-            # 신뢰도 점수 계산
-            confidence_score = self._calculate_confidence_score(data)
-            
-            return CrawlResult(
-                success=True,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                product_name=data.get('product_name'),
-                price=data.get('price'),
-                original_price=data.get('original_price'),
-                discount_rate=data.get('discount_rate'),
-                stock_status=data.get('stock_status', StockStatus.UNKNOWN),
-                promotion_info=data.get('promotion_info'),
-                image_url=data.get('image_url'),
-                category=data.get('category'),
-                brand=data.get('brand'),
-                rating=data.get('rating'),
-                confidence_score=confidence_score
-            )
+            return self._build_result(product_id, url, data)
             
         except TimeoutException:
             self.logger.error(f"Timeout loading Coupang page: {url}")
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message="페이지 로드 시간 초과"
-            )
+            return self._error_result(product_id, url, "페이지 로드 시간 초과")
             
         except Exception as e:
             self.logger.error(f"Error extracting Coupang data: {e}")
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message=str(e)
-            )
+            return self._error_result(product_id, url, str(e))
     
-    def _extract_text_by_selectors(self, selectors: list) -> Optional[str]:
+    def _stock_status_from_text(self, quantity_text: str) -> Optional[StockStatus]:
+        """재고 안내 문구에서 재고 상태 판별"""
+        # 키워드를 한 번의 스캔으로 모두 찾은 뒤 우선순위대로 판별
+        found = {_STOCK_KEYWORDS[keyword] for keyword in _STOCK_KEYWORD_RE.findall(quantity_text.lower())}
+        
+        for status in _STOCK_KEYWORD_PRIORITY:
+            if status in found:
+                return status
+        return None
+    
+    def _extract_from_html(self, tree: LexborHTMLParser) -> Dict[str, Any]:
+        """파싱된 HTML 트리에서 상품 데이터 추출"""
+        data = {}
+        selectors = self.selectors
+        
+        # 상품명
+        data['product_name'] = self._extract_text_by_selectors(tree, selectors['product_name'])
+        
+        # 가격 정보
+        current_price_text = self._extract_text_by_selectors(tree, selectors['current_price'])
+        data['price'] = self._extract_price(current_price_text) if current_price_text else None
+        
+        original_price_text = self._extract_text_by_selectors(tree, selectors['original_price'])
+        data['original_price'] = self._extract_price(original_price_text) if original_price_text else None
+        
+        # 할인율
+        discount_text = self._extract_text_by_selectors(tree, selectors['discount_rate'])
+        data['discount_rate'] = self._extract_discount_rate(discount_text) if discount_text else None
+        
+        # 재고 상태
+        data['stock_status'] = self._extract_stock_status(tree)
+        
+        # 프로모션 정보
+        data['promotion_info'] = self._extract_promotion_info(tree, selectors['promotion'])
+        
+        # 이미지 URL
+        data['image_url'] = self._extract_image_url(tree, selectors['image'])
+        
+        # 카테고리, 브랜드
+        data['category'] = self._extract_text_by_selectors(tree, selectors['category'])
+        data['brand'] = self._extract_text_by_selectors(tree, selectors['brand'])
+        
+        # 평점
+        rating_text = self._extract_text_by_selectors(tree, selectors['rating'])
+        data['rating'] = self._extract_rating(rating_text) if rating_text else None
+        
+        return data
+    
+    def _extract_text_by_selectors(self, tree: LexborHTMLParser, selectors: tuple) -> Optional[str]:
         """여러 셀렉터를 시도해서 텍스트 추출"""
         for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
+            node = tree.css_first(selector)
+            if node is not None:
+                text = node.text(separator=' ', strip=True)
                 if text:
                     return text
-            except NoSuchElementException:
-                continue
         return None
     
-    def _extract_stock_status(self) -> StockStatus:
+    def _extract_stock_status(self, tree: LexborHTMLParser) -> StockStatus:
         """재고 상태 추출"""
-        try:
-            # 품절 표시 확인
-            out_of_stock_indicators = [
-                '.out-of-stock',
-                '.sold-out',
-                '.temporary-out-of-stock'
-            ]
-            
-            for selector in out_of_stock_indicators:
-                try:
-                    self.driver.find_element(By.CSS_SELECTOR, selector)
-                    return StockStatus.OUT_OF_STOCK
-                except NoSuchElementException:
-                    continue
-            
-            # 수량 제한 확인
-            try:
-                quantity_element = self.driver.find_element(
-                    By.CSS_SELECTOR, '.prod-option-inventory, .quantity-info'
-                )
-                quantity_text = quantity_element.text.lower()
-                
-                if '품절' in quantity_text or 'out of stock' in quantity_text:
-                    return StockStatus.OUT_OF_STOCK
-                elif '수량한정' in quantity_text or '한정' in quantity_text:
-                    return StockStatus.LIMITED
-                elif '재고부족' in quantity_text or '재고 부족' in quantity_text:
-                    return StockStatus.CRITICAL
-                
-            except NoSuchElementException:
-                pass
-            
-            # 구매 버튼 상태 확인
-            try:
-                buy_button = self.driver.find_element(
-                    By.CSS_SELECTOR, '.prod-buy-btn, .buy-button'
-                )
-                if buy_button.is_enabled() and buy_button.is_displayed():
-                    return StockStatus.AVAILABLE
-                else:
-                    return StockStatus.OUT_OF_STOCK
-                    
-            except NoSuchElementException:
-                pass
-            
-            return StockStatus.AVAILABLE
-            
-        except Exception:
-            return StockStatus.UNKNOWN
+        # 품절 표시 확인
+        if tree.css_first(_OUT_OF_STOCK_SELECTOR) is not None:
+            return StockStatus.OUT_OF_STOCK
+        
+        # 수량 제한 확인
+        quantity_node = tree.css_first(_QUANTITY_SELECTOR)
+        if quantity_node is not None:
+            status = self._stock_status_from_text(quantity_node.text(separator=' ', strip=True))
+            if status:
+                return status
+        
+        # 구매 버튼 상태 확인 (비활성화 속성 여부)
+        buy_button = tree.css_first(_BUY_BUTTON_SELECTOR)
+        if buy_button is not None and 'disabled' in buy_button.attributes:
+            return StockStatus.OUT_OF_STOCK
+        
+        return StockStatus.AVAILABLE
     
-    def _extract_promotion_info(self, selectors: list) -> Optional[str]:
+    def _extract_promotion_info(self, tree: LexborHTMLParser, selectors: tuple) -> Optional[str]:
         """프로모션 정보 추출"""
         promotions = []
         
         for selector in selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    text = element.text.strip()
-                    if text and text not in promotions:
-                        promotions.append(text)
-            except NoSuchElementException:
-                continue
+            for node in tree.css(selector):
+                text = node.text(separator=' ', strip=True)
+                if text and text not in promotions:
+                    promotions.append(text)
         
         return ', '.join(promotions) if promotions else None
     
-    def _extract_image_url(self, selectors: list) -> Optional[str]:
+    def _extract_image_url(self, tree: LexborHTMLParser, selectors: tuple) -> Optional[str]:
         """이미지 URL 추출"""
         for selector in selectors:
-            try:
-                img_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                img_url = img_element.get_attribute('src')
+            node = tree.css_first(selector)
+            if node is not None:
+                img_url = node.attributes.get('src')
                 if img_url:
                     return img_url
-            except NoSuchElementException:
-                continue
         return None
     
     def _extract_discount_rate(self, discount_text: str) -> Optional[float]:
         """할인율 추출 (% 형태에서 숫자만)"""
         try:
             # %를 제거하고 숫자만 추출
-            rate_match = re.search(r'(\d+(?:\.\d+)?)%', discount_text)
+            rate_match = _DISCOUNT_RE.search(discount_text)
             if rate_match:
                 return float(rate_match.group(1))
         except (ValueError, AttributeError):
@@ -308,7 +326,7 @@ class CoupangCrawler(BaseCrawler):
         """평점 추출"""
         try:
             # 숫자와 소수점만 추출
-            rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
+            rating_match = _RATING_RE.search(rating_text)
             if rating_match:
                 rating = float(rating_match.group(1))
                 # 평점은 보통 5점 만점
@@ -5,22 +5,138 @@ This module implements the crawler for Naver Shopping (shopping.naver.com),
 which often provides structured data and can be scraped with HTTP requests.
 """
 
-import json
+import html
 import re
-from decimal import Decimal
-from typing import Dict, Optional
-from urllib.parse import urlparse, parse_qs
+from typing import Dict, Optional, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from selectolax.lexbor import LexborHTMLParser
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 
 from crawlers.core.base_crawler import BaseCrawler, CrawlResult
 from models.base import PlatformType, StockStatus
 
+# 할인율/평점 숫자 추출 패턴
+_DISCOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# JSON-LD 스크립트 본문 (HTML 파싱 없이 원본 바이트에서 바로 추출)
+_JSONLD_RE = re.compile(
+    rb'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Next.js 초기 상태 데이터 스크립트 본문
+_NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# HTML 대체 경로용 필드 패턴 (DOM 생성 없이 원본 바이트에서 추출)
+_NAME_RE = re.compile(rb'class="(?:product_title|prod_tit)"[^>]*>([^<]{1,200})<')
+_PRICE_NUM_RE = re.compile(rb'class="price_num"[^>]*>([\d,]+)')
+_IMAGE_RE = re.compile(rb'class="product_image"[^>]*>\s*<img[^>]+src="([^"]+)"')
+
+# Selenium 페이지 로드 완료 조건 (상품명 요소 등장)
+_READY_CONDITION = EC.any_of(
+    EC.presence_of_element_located((By.CLASS_NAME, "product_title")),
+    EC.presence_of_element_located((By.CLASS_NAME, "prod_tit"))
+)
+
+# 필드별 셀렉터를 우선순위대로 시도해 텍스트(이미지는 src)를 한 번에 수집하는 스크립트
+_COLLECT_FIELDS_JS = """
+const groups = arguments[0];
+const out = {};
+for (const [name, selectors] of Object.entries(groups)) {
+    out[name] = null;
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (!el) continue;
+        const value = name === 'image' ? el.getAttribute('src') : (el.innerText || '').trim();
+        if (value) { out[name] = value; break; }
+    }
+}
+return out;
+"""
+
+# 네이버쇼핑 플랫폼 CSS 셀렉터 (필드별 우선순위 순)
+_SELECTORS: Dict[str, Tuple[str, ...]] = {
+    # 상품명
+    'product_name': (
+        '.product_title',
+        '.prod_tit',
+        'h2.product_name',
+        '.product_info .title'
+    ),
+    
+    # 현재 가격
+    'current_price': (
+        '.price_num',
+        '.sale_price .price',
+        '.product_price .num',
+        '.price_area .price'
+    ),
+    
+    # 원래 가격
+    'original_price': (
+        '.origin_price .price',
+        '.before_price .price',
+        '.product_price .origin_price'
+    ),
+    
+    # 할인율
+    'discount_rate': (
+        '.discount_rate',
+        '.sale_rate',
+        '.discount_percent'
+    ),
+    
+    # 배송비/배송 정보
+    'shipping': (
+        '.delivery_info',
+        '.shipping_fee',
+        '.delivery_fee'
+    ),
+    
+    # 상품 이미지
+    'image': (
+        '.product_image img',
+        '.prod_img img',
+        '.thumb_area img'
+    ),
+    
+    # 카테고리
+    'category': (
+        '.product_category',
+        '.category_info',
+        '.breadcrumb'
+    ),
+    
+    # 브랜드/쇼핑몰
+    'brand': (
+        '.brand',
+        '.shop_name',
+        '.seller_name'
+    ),
+    
+    # 평점
+    'rating': (
+        '.rating_num',
+        '.score_num',
+        '.review_point'
+    ),
+    
+    # 리뷰 수
+    'review_count': (
+        '.review_count',
+        '.count_num'
+    )
+}
+
 
 class NaverShoppingCrawler(BaseCrawler):
     """네이버쇼핑 전용 크롤러"""
@@ -28,91 +144,16 @@ class NaverShoppingCrawler(BaseCrawler):
     def __init__(self, **kwargs):
         super().__init__(platform=PlatformType.NAVER_SHOPPING, **kwargs)
         
-        # 네이버쇼핑 특화 설정
-        self.request_delay = 2.0
+        # WebDriver 풀 크기만큼 동시 작업 허용
+        self.max_concurrency = self.driver_pool.size
         
-    def _is_platform_url(self, url: str) -> bool:
+    def _is_platform_url(self, host: str) -> bool:
         """네이버쇼핑 URL인지 확인"""
-        try:
-            parsed = urlparse(url)
-            return 'shopping.naver.com' in parsed.netloc.lower()
-        except Exception:
-            return False
+        return host == 'shopping.naver.com' or host.endswith('.shopping.naver.com')
     
-    def get_platform_selectors(self) -> Dict[str, str]:
+    def get_platform_selectors(self) -> Dict[str, Tuple[str, ...]]:
         """네이버쇼핑 플랫폼 CSS 셀렉터"""
-        return {
-            # 상품명
-            'product_name': [
-                '.product_title',
-                '.prod_tit',
-                'h2.product_name',
-                '.product_info .title'
-            ],
-            
-            # 현재 가격
-            'current_price': [
-                '.price_num',
-                '.sale_price .price',
-                '.product_price .num',
-                '.price_area .price'
-            ],
-            
-            # 원래 가격
-            'original_price': [
-                '.origin_price .price',
-                '.before_price .price',
-                '.product_price .origin_price'
-            ],
-            
-            # 할인율
-            'discount_rate': [
-                '.discount_rate',
-                '.sale_rate',
-                '.discount_percent'
-            ],
-            
-            # 배송비/배송 정보
-            'shipping': [
-                '.delivery_info',
-                '.shipping_fee',
-                '.delivery_fee'
-            ],
-            
-            # 상품 이미지
-            'image': [
-                '.product_image img',
-                '.prod_img img',
-                '.thumb_area img'
-            ],
-            
-            # 카테고리
-            'category': [
-                '.product_category',
-                '.category_info',
-                '.breadcrumb'
-            ],
-            
-            # 브랜드/쇼핑몰
-            'brand': [
-                '.brand',
-                '.shop_name',
-                '.seller_name'
-            ],
-            
-            # 평점
-            'rating': [
-                '.rating_num',
-                '.score_num',
-                '.review_point'
-            ],
-            
-            # 리뷰 수
-            'review_count': [
-                '.review_count',
-                '.count_num'
-            ]
-        }
+        return _SELECTORS
     
     async def extract_product_data(self, product_id: str, url: str) -> CrawlResult:
         """네이버쇼핑 상품 데이터 추출"""
@@ -134,18 +175,23 @@ class NaverShoppingCrawler(BaseCrawler):
             await self.initialize()
         
         try:
-            response = await self.http_client.get(url)
+            response = await self.http_client.get(url, headers=self.http_headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = response.content
             
-            # 구조화된 데이터 찾기 (JSON-LD)
-            structured_data = self._extract_structured_data(soup)
+            # 구조화된 데이터 찾기 (JSON-LD, DOM 생성 없이)
+            structured_data = self._extract_structured_data(content)
             if structured_data:
                 return self._parse_structured_data(structured_data, product_id, url)
             
+            # Next.js 초기 상태 데이터 (브라우저 렌더링 없이 상품 정보 확보)
+            next_product = self._extract_next_data_product(content)
+            if next_product:
+                return self._parse_next_data_product(next_product, product_id, url)
+            
             # 일반 HTML 파싱
-            return self._parse_html_content(soup, product_id, url)
+            return self._parse_html_content(content, product_id, url)
             
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
@@ -153,55 +199,52 @@ class NaverShoppingCrawler(BaseCrawler):
             raise
     
     async def _extract_with_selenium(self, product_id: str, url: str) -> CrawlResult:
-        """Selenium을 통한 데이터 추출"""
-        if not self.driver:
-            self.driver = self._init_webdriver()
-        
+        """Selenium을 통한 데이터 추출 (블로킹 호출은 스레드 풀에서 실행)"""
+        return await self._run_with_driver(self._sync_extract_with_selenium, product_id, url)
+    
+    def _sync_extract_with_selenium(self, driver: webdriver.Chrome, product_id: str, url: str) -> CrawlResult:
+        """Selenium 페이지 로드 및 추출 (동기)"""
         try:
-            self.driver.get(url)
+            driver.get(url)
             
             # 페이지 로드 완료 대기
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CLASS_NAME, "product_title")),
-                    EC.presence_of_element_located((By.CLASS_NAME, "prod_tit"))
-                )
-            )
+            self._wait_for(driver).until(_READY_CONDITION)
             
+            # 모든 필드를 한 번의 스크립트 실행으로 수집 (드라이버 왕복 1회)
+            fields = driver.execute_script(_COLLECT_FIELDS_JS, self.selectors)
             data = {}
-            selectors = self.get_platform_selectors()
             
             # 상품명
-            data['product_name'] = self._extract_text_by_selectors(selectors['product_name'])
+            data['product_name'] = fields.get('product_name')
             
             # 가격 정보
-            current_price_text = self._extract_text_by_selectors(selectors['current_price'])
+            current_price_text = fields.get('current_price')
             data['price'] = self._extract_price(current_price_text) if current_price_text else None
             
-            original_price_text = self._extract_text_by_selectors(selectors['original_price'])
+            original_price_text = fields.get('original_price')
             data['original_price'] = self._extract_price(original_price_text) if original_price_text else None
             
             # 할인율
-            discount_text = self._extract_text_by_selectors(selectors['discount_rate'])
+            discount_text = fields.get('discount_rate')
             data['discount_rate'] = self._extract_discount_rate(discount_text) if discount_text else None
             
             # 재고는 네이버쇼핑에서 명시적으로 표시되지 않으므로 구매 가능으로 간주
             data['stock_status'] = StockStatus.AVAILABLE
             
             # 배송 정보
-            data['promotion_info'] = self._extract_text_by_selectors(selectors['shipping'])
+            data['promotion_info'] = fields.get('shipping')
             
             # 이미지
-            data['image_url'] = self._extract_image_url(selectors['image'])
+            data['image_url'] = fields.get('image')
             
             # 카테고리
-            data['category'] = self._extract_text_by_selectors(selectors['category'])
+            data['category'] = fields.get('category')
             
             # 브랜드
-            data['brand'] = self._extract_text_by_selectors(selectors['brand'])
+            data['brand'] = fields.get('brand')
             
             # 평점
-            rating_text = self._extract_text_by_selectors(selectors['rating'])
+            rating_text = fields.get('rating')
             data['rating'] = self._extract_rating(rating_text) if rating_text else None
             
             # 신뢰도 점수 계산
@@ -226,59 +269,91 @@ class NaverShoppingCrawler(BaseCrawler):
             )
             
         except TimeoutException:
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message="페이지 로드 시간 초과"
-            )
+            return self._error_result(product_id, url, "페이지 로드 시간 초과")
         except Exception as e:
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message=str(e)
-            )
+            return self._error_result(product_id, url, str(e))
+    
+    def _extract_structured_data(self, content: bytes) -> Optional[dict]:
+        """구조화된 데이터 추출 (JSON-LD, 원본 바이트에서 정규식으로 스크립트 탐색)"""
+        for match in _JSONLD_RE.finditer(content):
+            raw = match.group(1)
+            
+            # Product 타입이 없는 블록(BreadcrumbList 등)은 디코딩하지 않음
+            if b'"Product"' not in raw:
+                continue
+            
+            try:
+                data = orjson.loads(raw)
+            except ValueError:
+                continue
+            
+            if isinstance(data, dict) and data.get('@type') == 'Product':
+                return data
+            elif isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and item.get('@type') == 'Product':
+                        return item
+        return None
     
-    def _extract_structured_data(self, soup: BeautifulSoup) -> Optional[dict]:
-        """구조화된 데이터 추출 (JSON-LD)"""
+    def _extract_next_data_product(self, content: bytes) -> Optional[dict]:
+        """__NEXT_DATA__의 상품 객체 추출 (상품명과 가격이 있는 경우만)"""
+        match = _NEXT_DATA_RE.search(content)
+        if not match:
+            return None
+        
         try:
-            scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    return data
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict) and item.get('@type') == 'Product':
-                            return item
-        except (json.JSONDecodeError, AttributeError):
-            pass
+            next_data = orjson.loads(match.group(1))
+            product = next_data['props']['pageProps']['product']
+        except (ValueError, KeyError, TypeError):
+            return None
+        
+        if isinstance(product, dict) and product.get('name') and product.get('price') is not None:
+            return product
         return None
     
+    def _parse_next_data_product(self, product: dict, product_id: str, url: str) -> CrawlResult:
+        """Next.js 상품 객체 파싱"""
+        image_url = product.get('imageUrl') or product.get('image')
+        if isinstance(image_url, list):
+            image_url = image_url[0] if image_url else None
+        
+        data = {
+            'product_name': product['name'],
+            'price': self._price_value(product['price']),
+            'image_url': image_url
+        }
+        
+        return CrawlResult(
+            success=True,
+            product_id=product_id,
+            platform=self.platform,
+            url=url,
+            stock_status=StockStatus.AVAILABLE,
+            confidence_score=self._calculate_confidence_score(data),
+            **data
+        )
+    
     def _parse_structured_data(self, data: dict, product_id: str, url: str) -> CrawlResult:
         """구조화된 데이터 파싱"""
         try:
-            product_name = data.get('name')
+            fields = {'product_name': data.get('name')}
             
             # 가격 정보
             offers = data.get('offers', {})
             if isinstance(offers, list):
                 offers = offers[0] if offers else {}
             
-            price_text = str(offers.get('price', ''))
-            price = self._extract_price(price_text) if price_text else None
+            fields['price'] = self._price_value(offers.get('price'))
             
             # 이미지
             image_url = data.get('image')
             if isinstance(image_url, list):
                 image_url = image_url[0] if image_url else None
+            fields['image_url'] = image_url
             
             # 브랜드
             brand_info = data.get('brand', {})
-            brand = brand_info.get('name') if isinstance(brand_info, dict) else str(brand_info)
+            fields['brand'] = brand_info.get('name') if isinstance(brand_info, dict) else str(brand_info)
             
             # 평점
             rating_info = data.get('aggregateRating', {})
@@ -287,100 +362,95 @@ class NaverShoppingCrawler(BaseCrawler):
                 rating_value = rating_info.get('ratingValue')
                 if rating_value:
                     rating = float(rating_value)
-            
-            confidence_score = self._calculate_confidence_score({
-                'product_name': product_name,
-                'price': price,
-                'image_url': image_url,
-                'brand': brand,
-                'rating': rating
-            })
+            fields['rating'] = rating
             
             return CrawlResult(
                 success=True,
                 product_id=product_id,
                 platform=self.platform,
                 url=url,
-                product_name=product_name,
-                price=price,
                 stock_status=StockStatus.AVAILABLE,
-                image_url=image_url,
-                brand=brand,
-                rating=rating,
-                confidence_score=confidence_score
+                confidence_score=self._calculate_confidence_score(fields),
+                **fields
             )
             
         except Exception as e:
             raise Exception(f"구조화된 데이터 파싱 실패: {e}")
     
-    def _parse_html_content(self, soup: BeautifulSoup, product_id: str, url: str) -> CrawlResult:
-        """일반 HTML 컨텐츠 파싱"""
-        data = {}
-        
-        # 상품명
-        for selector in self.get_platform_selectors()['product_name']:
-            element = soup.select_one(selector)
-            if element:
-                data['product_name'] = element.get_text(strip=True)
-                break
-        
-        # 가격
-        for selector in self.get_platform_selectors()['current_price']:
-            element = soup.select_one(selector)
-            if element:
-                price_text = element.get_text(strip=True)
-                data['price'] = self._extract_price(price_text)
-                break
-        
-        # 이미지
-        for selector in self.get_platform_selectors()['image']:
-            element = soup.select_one(selector)
-            if element:
-                data['image_url'] = element.get('src')
-                break
-        
-        confidence_score = self._calculate_confidence_score(data)
+    def _parse_html_content(self, content: bytes, product_id: str, url: str) -> CrawlResult:
+        """일반 HTML 컨텐츠 파싱 (정규식 우선, 필수 필드가 없으면 DOM 파싱)"""
+        data = self._scan_html_fields(content)
+        if data is None:
+            data = self._extract_html_fields(self._parse_html(content))
         
         return CrawlResult(
             success=True,
             product_id=product_id,
             platform=self.platform,
             url=url,
-            product_name=data.get('product_name'),
-            price=data.get('price'),
             stock_status=StockStatus.AVAILABLE,
-            image_url=data.get('image_url'),
-            confidence_score=confidence_score
+            confidence_score=self._calculate_confidence_score(data),
+            **data
         )
     
-    def _extract_text_by_selectors(self, selectors: list) -> Optional[str]:
-        """여러 셀렉터를 시도해서 텍스트 추출 (Selenium용)"""
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text:
-                    return text
-            except NoSuchElementException:
-                continue
-        return None
+    def _scan_html_fields(self, content: bytes) -> Optional[dict]:
+        """원본 바이트에서 상품명/가격/이미지를 정규식으로 추출 (상품명과 가격이 모두 있을 때만)"""
+        name_match = _NAME_RE.search(content)
+        price_match = _PRICE_NUM_RE.search(content)
+        if not (name_match and price_match):
+            return None
+        
+        product_name = html.unescape(name_match.group(1).decode('utf-8', 'replace')).strip()
+        if not product_name:
+            return None
+        
+        data = {
+            'product_name': product_name,
+            'price': self._extract_price(price_match.group(1).decode('ascii'))
+        }
+        
+        image_match = _IMAGE_RE.search(content)
+        if image_match:
+            data['image_url'] = html.unescape(image_match.group(1).decode('utf-8', 'replace'))
+        
+        return data
+    
+    def _extract_html_fields(self, tree: LexborHTMLParser) -> dict:
+        """DOM 트리에서 상품명/가격/이미지 추출 (필드별 셀렉터 우선순위 순)"""
+        data = {}
+        selectors = self.selectors
+        
+        # 상품명
+        element = self._first_match(tree, selectors['product_name'])
+        if element:
+            data['product_name'] = element.text(strip=True)
+        
+        # 가격
+        element = self._first_match(tree, selectors['current_price'])
+        if element:
+            data['price'] = self._extract_price(element.text(strip=True))
+        
+        # 이미지
+        element = self._first_match(tree, selectors['image'])
+        if element:
+            data['image_url'] = element.attributes.get('src')
+        
+        return data
     
-    def _extract_image_url(self, selectors: list) -> Optional[str]:
-        """이미지 URL 추출 (Selenium용)"""
+    @staticmethod
+    def _first_match(tree: LexborHTMLParser, selectors: Tuple[str, ...]):
+        """우선순위가 가장 높은 셀렉터와 일치하는 첫 요소 (앞 셀렉터가 맞으면 나머지는 탐색 안 함)"""
+        css_first = tree.css_first
         for selector in selectors:
-            try:
-                img_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                img_url = img_element.get_attribute('src')
-                if img_url:
-                    return img_url
-            except NoSuchElementException:
-                continue
+            element = css_first(selector)
+            if element is not None:
+                return element
         return None
     
     def _extract_discount_rate(self, discount_text: str) -> Optional[float]:
         """할인율 추출"""
         try:
-            rate_match = re.search(r'(\d+(?:\.\d+)?)%', discount_text)
+            rate_match = _DISCOUNT_RE.search(discount_text)
             if rate_match:
                 return float(rate_match.group(1))
         except (ValueError, AttributeError):
@@ -390,7 +460,7 @@ class NaverShoppingCrawler(BaseCrawler):
     def _extract_rating(self, rating_text: str) -> Optional[float]:
         """평점 추출"""
         try:
-            rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
+            rating_match = _RATING_RE.search(rating_text)
             if rating_match:
                 rating = float(rating_match.group(1))
                 if 0 <= rating <= 5:
@@ -5,20 +5,227 @@ This module implements the crawler for Naver Smart Store (smartstore.naver.com),
 which is React-based and requires JavaScript rendering.
 """
 
-import json
 import re
-from decimal import Decimal
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import httpx
+import orjson
+from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from crawlers.core.base_crawler import BaseCrawler, CrawlResult
 from models.base import PlatformType, StockStatus
 
+# 할인율/평점 숫자 추출 패턴
+_DISCOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# 재고 상태 키워드 패턴 (대소문자 무시)
+_SOLDOUT_RE = re.compile(r'품절|판매종료|sold[\s_-]?out', re.IGNORECASE)
+_LOWSTOCK_RE = re.compile(r'재고부족|low[\s_-]?stock', re.IGNORECASE)
+_BUY_RE = re.compile(r'구매하기|buy', re.IGNORECASE)
+
+# schema.org availability 값과 재고 상태 매핑 (앞에서부터 확인)
+_AVAILABILITY_STATUS = (
+    ('OutOfStock', StockStatus.OUT_OF_STOCK),
+    ('SoldOut', StockStatus.OUT_OF_STOCK),
+    ('Discontinued', StockStatus.OUT_OF_STOCK),
+    ('LimitedAvailability', StockStatus.LIMITED),
+    ('InStock', StockStatus.AVAILABLE),
+)
+
+# 페이지 준비 판단 셀렉터 (상품명 등장 후 가격 영역이 렌더링되면 준비 완료)
+_READY_SELECTOR = '[class*="ProductTitle"], .product_name h2, ._2huTLaXgWw'
+_PRICE_READY_SELECTOR = '[class*="ProductPrice"]'
+
+# 상품명 등장 후 가격 영역을 기다리는 최대 시간 (밀리초)
+_PRICE_GRACE_MS = 2000
+
+# MutationObserver로 준비 상태를 감지해 콜백하는 비동기 스크립트 (시간 초과 시 false)
+_WAIT_READY_JS = """
+const [readySelector, priceSelector, timeoutMs, graceMs, done] = arguments;
+let graceTimer = null;
+let finished = false;
+const finish = (ok) => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timeoutTimer);
+    clearTimeout(graceTimer);
+    done(ok);
+};
+const check = () => {
+    if (!document.querySelector(readySelector)) return;
+    if (document.querySelector(priceSelector)) return finish(true);
+    if (graceTimer === null) graceTimer = setTimeout(() => finish(true), graceMs);
+};
+const observer = new MutationObserver(check);
+const timeoutTimer = setTimeout(() => finish(false), timeoutMs);
+observer.observe(document, {childList: true, subtree: true});
+check();
+"""
+
+# JSON-LD 및 Next.js 초기 데이터 스크립트 본문 수집
+_STRUCTURED_DATA_JS = """
+const nextData = document.getElementById('__NEXT_DATA__');
+return {
+    json_ld: Array.from(
+        document.querySelectorAll('script[type="application/ld+json"]'), (el) => el.textContent
+    ),
+    next_data: nextData ? nextData.textContent : null
+};
+"""
+
+# 스크립트로 한 번에 수집하는 텍스트 필드
+_TEXT_FIELDS = (
+    'product_name', 'current_price', 'original_price', 'discount_rate',
+    'brand', 'rating', 'shipping'
+)
+
+# 텍스트/이미지/재고 신호/카테고리를 페이지 안에서 한 번에 수집하는 스크립트
+# (값 필드는 셀렉터 우선순위 순, 재고 신호는 합친 셀렉터 그룹으로 조회)
+_COLLECT_FIELDS_JS = """
+const [selectors, groups, textFields] = arguments;
+const all = (selector) => Array.from(document.querySelectorAll(selector));
+const textOf = (el) => (el.innerText || '').trim();
+const imageOf = (img) => {
+    let src = img.src;
+    if (!src || src.includes('data:image')) src = img.getAttribute('data-src');
+    return src && src.startsWith('http') ? src : null;
+};
+// 값 필드는 셀렉터 우선순위 순으로 시도 (앞 셀렉터가 맞으면 뒤 셀렉터는 탐색 안 함)
+const firstValue = (name, valueOf) => {
+    for (const selector of selectors[name]) {
+        for (const el of all(selector)) {
+            const value = valueOf(el);
+            if (value) return value;
+        }
+    }
+    return null;
+};
+const out = {texts: {}, category: []};
+
+for (const name of textFields) out.texts[name] = firstValue(name, textOf);
+out.image = firstValue('image', imageOf);
+
+out.sold_out_visible = all(groups.out_of_stock).some((el) => el.getClientRects().length > 0);
+out.buy_buttons = all(groups.buy_button).map((el) => [el.innerText || '', !el.disabled]);
+out.options = all(groups.option_area).map((el) => el.innerText || '');
+
+for (const selector of selectors.category) {
+    for (const el of all(selector)) {
+        const text = textOf(el);
+        if (text && !out.category.includes(text)) out.category.push(text);
+    }
+    if (out.category.length) break;
+}
+return out;
+"""
+
+# 스마트스토어 플랫폼 CSS 셀렉터 (필드별 우선순위 순)
+_SELECTORS: Dict[str, Tuple[str, ...]] = {
+    # 상품명
+    'product_name': (
+        '.ProductTitle__title___2-5QT',
+        '._2huTLaXgWw',
+        '.ProductTitle-module__title',
+        '.product_name h2',
+        'h2[class*="ProductTitle"]'
+    ),
+    
+    # 현재 가격
+    'current_price': (
+        '.ProductPrice__value___2e-5e',
+        '._1Z7oH6yCQ0',
+        '.ProductPrice-module__value',
+        '.price .num strong',
+        '[class*="ProductPrice"] [class*="value"]'
+    ),
+    
+    # 원래 가격
+    'original_price': (
+        '.ProductPrice__origin___3QKJe',
+        '.origin_price .num',
+        '[class*="ProductPrice"] [class*="origin"]'
+    ),
+    
+    # 할인율
+    'discount_rate': (
+        '.ProductPrice__discount___1KEbP',
+        '.discount_rate',
+        '[class*="ProductPrice"] [class*="discount"]'
+    ),
+    
+    # 옵션/재고 영역
+    'option_area': (
+        '.ProductOption__option___3_W4I',
+        '.OptionList__option___2a3xh',
+        '.product_option_area',
+        '[class*="ProductOption"]'
+    ),
+    
+    # 구매 버튼
+    'buy_button': (
+        '.Button__button___3-8uJ[class*="primary"]',
+        '.ProductButton__button___2oUJl',
+        '.buy_button',
+        '[class*="ProductButton"]'
+    ),
+    
+    # 품절 표시
+    'out_of_stock': (
+        '.ProductButton__soldout___-8PpF',
+        '.soldout',
+        '[class*="soldout"]',
+        '[class*="SoldOut"]'
+    ),
+    
+    # 상품 이미지
+    'image': (
+        '.ProductImage__image___1TmPp img',
+        '.product_image img',
+        '[class*="ProductImage"] img',
+        '.thumb_area img'
+    ),
+    
+    # 브랜드/스토어명
+    'brand': (
+        '.ProductBrand__name___1b2fq',
+        '.brand_name',
+        '.store_name',
+        '[class*="ProductBrand"]'
+    ),
+    
+    # 카테고리 (breadcrumb)
+    'category': (
+        '.Breadcrumb__item___1-Hha',
+        '.breadcrumb_item',
+        '[class*="Breadcrumb"]'
+    ),
+    
+    # 평점
+    'rating': (
+        '.ProductReview__rating___12_qJ',
+        '.review_rating .num',
+        '[class*="ProductReview"] [class*="rating"]'
+    ),
+    
+    # 리뷰 수
+    'review_count': (
+        '.ProductReview__count___h8aEB',
+        '.review_count',
+        '[class*="ProductReview"] [class*="count"]'
+    ),
+    
+    # 배송 정보
+    'shipping': (
+        '.ProductDelivery__info___3hHJM',
+        '.delivery_info',
+        '[class*="ProductDelivery"]'
+    )
+}
+
 
 class SmartStoreCrawler(BaseCrawler):
     """네이버 스마트스토어 전용 크롤러"""
@@ -30,177 +237,107 @@ class SmartStoreCrawler(BaseCrawler):
         self.request_delay = 3.0
         self.timeout = 40  # 더 긴 대기시간
         
-    def _is_platform_url(self, url: str) -> bool:
+        # WebDriver 풀 크기만큼 동시 작업 허용
+        self.max_concurrency = self.driver_pool.size
+        
+    def _is_platform_url(self, host: str) -> bool:
         """스마트스토어 URL인지 확인"""
-        try:
-            parsed = urlparse(url)
-            return 'smartstore.naver.com' in parsed.netloc.lower()
-        except Exception:
-            return False
+        return host == 'smartstore.naver.com' or host.endswith('.smartstore.naver.com')
     
-    def get_platform_selectors(self) -> Dict[str, str]:
+    def get_platform_selectors(self) -> Dict[str, Tuple[str, ...]]:
         """스마트스토어 플랫폼 CSS 셀렉터"""
-        return {
-            # 상품명
-            'product_name': [
-                '.ProductTitle__title___2-5QT',
-                '._2huTLaXgWw',
-                '.ProductTitle-module__title',
-                '.product_name h2',
-                'h2[class*="ProductTitle"]'
-            ],
-            
-            # 현재 가격
-            'current_price': [
-                '.ProductPrice__value___2e-5e',
-                '._1Z7oH6yCQ0',
-                '.ProductPrice-module__value',
-                '.price .num strong',
-                '[class*="ProductPrice"] [class*="value"]'
-            ],
-            
-            # 원래 가격
-            'original_price': [
-                '.ProductPrice__origin___3QKJe',
-                '.origin_price .num',
-                '[class*="ProductPrice"] [class*="origin"]'
-            ],
-            
-            # 할인율
-            'discount_rate': [
-                '.ProductPrice__discount___1KEbP',
-                '.discount_rate',
-                '[class*="ProductPrice"] [class*="discount"]'
-            ],
-            
-            # 옵션/재고 영역
-            'option_area': [
-                '.ProductOption__option___3_W4I',
-                '.OptionList__option___2a3xh',
-                '.product_option_area',
-                '[class*="ProductOption"]'
-            ],
-            
-            # 구매 버튼
-            'buy_button': [
-                '.Button__button___3-8uJ[class*="primary"]',
-                '.ProductButton__button___2oUJl',
-                '.buy_button',
-                '[class*="ProductButton"]'
-            ],
-            
-            # 품절 표시
-            'out_of_stock': [
-                '.ProductButton__soldout___-8PpF',
-                '.soldout',
-                '[class*="soldout"]',
-                '[class*="SoldOut"]'
-            ],
-            
-            # 상품 이미지
-            'image': [
-                '.ProductImage__image___1TmPp img',
-                '.product_image img',
-                '[class*="ProductImage"] img',
-                '.thumb_area img'
-            ],
-            
-            # 브랜드/스토어명
-            'brand': [
-                '.ProductBrand__name___1b2fq',
-                '.brand_name',
-                '.store_name',
-                '[class*="ProductBrand"]'
-            ],
-            
-            # 카테고리 (breadcrumb)
-            'category': [
-                '.Breadcrumb__item___1-Hha',
-                '.breadcrumb_item',
-                '[class*="Breadcrumb"]'
-            ],
-            
-            # 평점
-            'rating': [
-                '.ProductReview__rating___12_qJ',
-                '.review_rating .num',
-                '[class*="ProductReview"] [class*="rating"]'
-            ],
-            
-            # 리뷰 수
-            'review_count': [
-                '.ProductReview__count___h8aEB',
-                '.review_count',
-                '[class*="ProductReview"] [class*="count"]'
-            ],
-            
-            # 배송 정보
-            'shipping': [
-                '.ProductDelivery__info___3hHJM',
-                '.delivery_info',
-                '[class*="ProductDelivery"]'
-            ]
-        }
+        return _SELECTORS
     
     async def extract_product_data(self, product_id: str, url: str) -> CrawlResult:
-        """스마트스토어 상품 데이터 추출"""
-        if not self.driver:
-            self.driver = self._init_webdriver()
+        """스마트스토어 상품 데이터 추출 (정적 HTML 우선, 부족하면 풀의 드라이버로 렌더링)"""
+        result = await self._try_static_extract(product_id, url)
+        if result is not None:
+            return result
+        
+        # 블로킹 Selenium 호출은 스레드 풀에서 실행
+        return await self._run_with_driver(self._sync_extract_product_data, product_id, url)
+    
+    async def _try_static_extract(self, product_id: str, url: str) -> Optional[CrawlResult]:
+        """HTTP 요청만으로 JSON-LD/__NEXT_DATA__에서 상품명/가격/재고 상태를 얻으면 결과 반환"""
+        if not self.http_client:
+            await self.initialize()
         
         try:
-            self.driver.get(url)
-            
-            # React 앱 로딩 완료 대기
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="ProductTitle"]')),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.product_name h2')),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '._2huTLaXgWw'))
-                )
-            )
+            response = await self.http_client.get(url, headers=self.http_headers)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.logger.debug(f"정적 추출 요청 실패, Selenium으로 시도: {e}")
+            return None
+        
+        data = self._extract_structured_data_from_html(response.content)
+        if not data.get('product_name') or data.get('price') is None:
+            return None
+        
+        # 재고 상태를 확정하지 못하면 UNKNOWN으로 저장되어 기존 재고 상태를 덮으므로 렌더링 경로로 처리
+        if data.get('stock_status') in (None, StockStatus.UNKNOWN):
+            return None
+        
+        return CrawlResult(
+            success=True,
+            product_id=product_id,
+            platform=self.platform,
+            url=url,
+            confidence_score=self._calculate_confidence_score(data),
+            **data
+        )
+    
+    def _sync_extract_product_data(self, driver: webdriver.Chrome, product_id: str, url: str) -> CrawlResult:
+        """스마트스토어 페이지 로드 및 추출 (동기)"""
+        try:
+            driver.get(url)
             
-            # 추가 로딩 대기 (동적 컨텐츠)
-            import asyncio
-            await asyncio.sleep(2)
+            # React 앱 로딩 완료 대기 (페이지 안에서 DOM 변경을 감지, 폴링 없음)
+            ready = driver.execute_async_script(
+                _WAIT_READY_JS, _READY_SELECTOR, _PRICE_READY_SELECTOR,
+                self.timeout * 1000, _PRICE_GRACE_MS
+            )
+            if not ready:
+                raise TimeoutException("SmartStore product title did not appear")
             
+            # 페이지 필드 원본 값 수집 (한 번의 스크립트 실행)
+            fields = self._collect_page_fields(driver)
             data = {}
-            selectors = self.get_platform_selectors()
             
             # 상품명 추출
-            data['product_name'] = self._extract_text_by_selectors(selectors['product_name'])
+            data['product_name'] = fields['product_name']
             
             # 가격 정보 추출
-            current_price_text = self._extract_text_by_selectors(selectors['current_price'])
+            current_price_text = fields['current_price']
             data['price'] = self._extract_price(current_price_text) if current_price_text else None
             
-            original_price_text = self._extract_text_by_selectors(selectors['original_price'])
+            original_price_text = fields['original_price']
             data['original_price'] = self._extract_price(original_price_text) if original_price_text else None
             
             # 할인율 추출
-            discount_text = self._extract_text_by_selectors(selectors['discount_rate'])
+            discount_text = fields['discount_rate']
             data['discount_rate'] = self._extract_discount_rate(discount_text) if discount_text else None
             
             # 재고 상태 확인
-            data['stock_status'] = self._extract_stock_status()
+            data['stock_status'] = fields['stock_status']
             
             # 이미지 URL
-            data['image_url'] = self._extract_image_url(selectors['image'])
+            data['image_url'] = fields['image']
             
             # 브랜드/스토어명
-            data['brand'] = self._extract_text_by_selectors(selectors['brand'])
+            data['brand'] = fields['brand']
             
             # 카테고리
-            data['category'] = self._extract_category()
+            data['category'] = fields['category']
             
             # 평점
-            rating_text = self._extract_text_by_selectors(selectors['rating'])
+            rating_text = fields['rating']
             data['rating'] = self._extract_rating(rating_text) if rating_text else None
             
             # 배송 정보
-            data['promotion_info'] = self._extract_text_by_selectors(selectors['shipping'])
+            data['promotion_info'] = fields['shipping']
             
             # 구조화된 데이터에서 추가 정보 추출
-            structured_data = self._extract_structured_data_from_page()
+            structured_data = self._extract_structured_data_from_page(driver)
             if structured_data:
                 data.update(structured_data)
             
@@ -227,169 +364,188 @@ class SmartStoreCrawler(BaseCrawler):
             
         except TimeoutException:
             self.logger.error(f"Timeout loading SmartStore page: {url}")
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message="페이지 로드 시간 초과 (React 앱 로딩 실패)"
-            )
+            return self._error_result(product_id, url, "페이지 로드 시간 초과 (React 앱 로딩 실패)")
             
         except Exception as e:
             self.logger.error(f"Error extracting SmartStore data: {e}")
-            return CrawlResult(
-                success=False,
-                product_id=product_id,
-                platform=self.platform,
-                url=url,
-                error_message=str(e)
+            return self._error_result(product_id, url, str(e))
+        
+        finally:
+            self._reset_driver(driver)
+    
+    def _reset_driver(self, driver: webdriver.Chrome):
+        """다음 상품을 위해 드라이버 상태 초기화 (브라우저는 종료하지 않고 재사용)"""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException as e:
+            self.logger.debug(f"드라이버 초기화 실패: {e}")
+    
+    def _collect_page_fields(self, driver: webdriver.Chrome) -> Dict[str, Any]:
+        """페이지의 필드 값을 한 번의 execute_script로 수집 (실패 시 요소별 조회로 대체)"""
+        try:
+            raw = driver.execute_script(
+                _COLLECT_FIELDS_JS, self.selectors, self.selector_groups, _TEXT_FIELDS
             )
+        except WebDriverException as e:
+            self.logger.debug(f"스크립트 일괄 수집 실패, 요소별 조회로 대체: {e}")
+            fields = {name: self._extract_text_by_selectors(driver, name) for name in _TEXT_FIELDS}
+            fields['image'] = self._extract_image_url(driver, 'image')
+            fields['stock_status'] = self._extract_stock_status(driver)
+            fields['category'] = self._extract_category(driver)
+            return fields
+        
+        fields = raw['texts']
+        fields['image'] = raw['image']
+        fields['stock_status'] = self._stock_status_from_signals(
+            raw['sold_out_visible'], raw['buy_buttons'], raw['options']
+        )
+        fields['category'] = ' > '.join(raw['category']) or None
+        return fields
     
-    def _extract_text_by_selectors(self, selectors: list) -> Optional[str]:
-        """여러 셀렉터를 시도해서 텍스트 추출"""
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text and text != '':
-                    return text
-            except NoSuchElementException:
-                continue
+    def _stock_status_from_signals(
+        self, sold_out_visible: bool, buy_buttons: Iterable[Tuple[str, bool]], options: Iterable[str]
+    ) -> StockStatus:
+        """품절 표시/구매 버튼/옵션 텍스트로 재고 상태 판정 (판정이 나면 남은 신호는 읽지 않음)"""
+        # 품절 표시 확인
+        if sold_out_visible:
+            return StockStatus.OUT_OF_STOCK
+        
+        # 구매 버튼 상태 확인
+        for button_text, enabled in buy_buttons:
+            if _SOLDOUT_RE.search(button_text):
+                return StockStatus.OUT_OF_STOCK
+            elif _BUY_RE.search(button_text):
+                return StockStatus.AVAILABLE if enabled else StockStatus.OUT_OF_STOCK
+        
+        # 옵션 영역에서 재고 정보 확인
+        for option_text in options:
+            if _SOLDOUT_RE.search(option_text):
+                return StockStatus.LIMITED  # 일부 옵션 품절
+            elif _LOWSTOCK_RE.search(option_text):
+                return StockStatus.CRITICAL
+        
+        # 기본값은 구매 가능으로 간주
+        return StockStatus.AVAILABLE
+    
+    def _find_group(self, driver: webdriver.Chrome, name: str) -> list:
+        """재고 신호 필드의 셀렉터 그룹과 일치하는 요소를 한 번의 조회로 가져옴 (문서 순서)"""
+        return driver.find_elements(By.CSS_SELECTOR, self.selector_groups[name])
+    
+    def _iter_by_priority(self, driver: webdriver.Chrome, name: str) -> Iterator:
+        """값 필드의 요소를 셀렉터 우선순위 순으로 조회 (필요한 셀렉터까지만 조회)"""
+        for selector in self.sel(name):
+            yield from driver.find_elements(By.CSS_SELECTOR, selector)
+    
+    def _extract_text_by_selectors(self, driver: webdriver.Chrome, name: str) -> Optional[str]:
+        """우선순위가 가장 높은 셀렉터부터 처음으로 텍스트가 있는 요소의 텍스트 추출"""
+        for element in self._iter_by_priority(driver, name):
+            text = element.text.strip()
+            if text:
+                return text
         return None
     
-    def _extract_stock_status(self) -> StockStatus:
+    def _extract_stock_status(self, driver: webdriver.Chrome) -> StockStatus:
         """재고 상태 추출"""
         try:
-            # 품절 표시 확인
-            selectors = self.get_platform_selectors()
+            # 품절 표시가 보이면 구매 버튼/옵션 영역은 조회하지 않음
+            if any(element.is_displayed() for element in self._find_group(driver, 'out_of_stock')):
+                return StockStatus.OUT_OF_STOCK
             
-            for selector in selectors['out_of_stock']:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        return StockStatus.OUT_OF_STOCK
-                except NoSuchElementException:
-                    continue
-            
-            # 구매 버튼 상태 확인
-            for selector in selectors['buy_button']:
-                try:
-                    buy_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    # 버튼 텍스트 확인
-                    button_text = buy_button.text.lower()
-                    if any(word in button_text for word in ['품절', 'soldout', '판매종료']):
-                        return StockStatus.OUT_OF_STOCK
-                    elif '구매하기' in button_text or 'buy' in button_text:
-                        if buy_button.is_enabled():
-                            return StockStatus.AVAILABLE
-                        else:
-                            return StockStatus.OUT_OF_STOCK
-                    
-                except NoSuchElementException:
-                    continue
-            
-            # 옵션 영역에서 재고 정보 확인
-            for selector in self.get_platform_selectors()['option_area']:
-                try:
-                    option_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for option in option_elements:
-                        option_text = option.text.lower()
-                        if '품절' in option_text or 'soldout' in option_text:
-                            return StockStatus.LIMITED  # 일부 옵션 품절
-                        elif '재고부족' in option_text:
-                            return StockStatus.CRITICAL
-                except NoSuchElementException:
-                    continue
-            
-            # 기본값은 구매 가능으로 간주
-            return StockStatus.AVAILABLE
+            return self._stock_status_from_signals(
+                False, self._iter_buy_buttons(driver), self._iter_option_texts(driver)
+            )
             
         except Exception:
             return StockStatus.UNKNOWN
     
-    def _extract_image_url(self, selectors: list) -> Optional[str]:
+    def _iter_buy_buttons(self, driver: webdriver.Chrome) -> Iterator[Tuple[str, bool]]:
+        """구매 버튼 (텍스트, 활성 여부)를 필요할 때만 조회"""
+        for button in self._find_group(driver, 'buy_button'):
+            yield button.text, button.is_enabled()
+    
+    def _iter_option_texts(self, driver: webdriver.Chrome) -> Iterator[str]:
+        """옵션 영역 텍스트를 필요할 때만 조회"""
+        for option in self._find_group(driver, 'option_area'):
+            yield option.text
+    
+    def _extract_image_url(self, driver: webdriver.Chrome, name: str) -> Optional[str]:
         """이미지 URL 추출"""
-        for selector in selectors:
-            try:
-                img_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                img_url = img_element.get_attribute('src')
-                
-                # lazy loading 이미지 처리
-                if not img_url or 'data:image' in img_url:
-                    img_url = img_element.get_attribute('data-src')
-                
-                if img_url and img_url.startswith('http'):
-                    return img_url
-                    
-            except NoSuchElementException:
-                continue
+        for img_element in self._iter_by_priority(driver, name):
+            img_url = img_element.get_attribute('src')
+            
+            # lazy loading 이미지 처리
+            if not img_url or 'data:image' in img_url:
+                img_url = img_element.get_attribute('data-src')
+            
+            if img_url and img_url.startswith('http'):
+                return img_url
         return None
     
-    def _extract_category(self) -> Optional[str]:
+    def _extract_category(self, driver: webdriver.Chrome) -> Optional[str]:
         """카테고리 정보 추출 (breadcrumb)"""
-        try:
-            selectors = self.get_platform_selectors()['category']
-            categories = []
-            
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and text not in categories:
-                            categories.append(text)
-                    
-                    if categories:
-                        return ' > '.join(categories)
-                        
-                except NoSuchElementException:
-                    continue
+        categories = []
+        
+        for selector in self.sel('category'):
+            # find_elements는 미일치 시 빈 리스트를 반환하므로 stale 요소/잘못된 셀렉터만 처리
+            try:
+                for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                    text = element.text.strip()
+                    if text and text not in categories:
+                        categories.append(text)
+            except WebDriverException:
+                continue
             
-        except Exception:
-            pass
+            if categories:
+                return ' > '.join(categories)
         
         return None
     
-    def _extract_structured_data_from_page(self) -> Dict:
+    def _extract_structured_data_from_page(self, driver: webdriver.Chrome) -> Dict:
         """페이지에서 구조화된 데이터 추출"""
         try:
-            # JSON-LD 스크립트 태그 찾기
-            scripts = self.driver.find_elements(By.CSS_SELECTOR, 'script[type="application/ld+json"]')
-            
-            for script in scripts:
-                try:
-                    script_content = script.get_attribute('innerHTML')
-                    if script_content:
-                        data = json.loads(script_content)
-                        
-                        if isinstance(data, dict) and data.get('@type') == 'Product':
-                            return self._parse_structured_product_data(data)
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict) and item.get('@type') == 'Product':
-                                    return self._parse_structured_product_data(item)
-                                    
-                except (json.JSONDecodeError, Exception):
-                    continue
-            
-            # Next.js 앱의 초기 상태 데이터 확인
-            try:
-                next_data_script = self.driver.find_element(
-                    By.CSS_SELECTOR, 'script#__NEXT_DATA__'
-                )
-                if next_data_script:
-                    next_data = json.loads(next_data_script.get_attribute('innerHTML'))
-                    return self._parse_next_data(next_data)
-                    
-            except (NoSuchElementException, json.JSONDecodeError):
-                pass
+            # JSON-LD / Next.js 스크립트 본문을 한 번의 왕복으로 가져옴
+            payloads = driver.execute_script(_STRUCTURED_DATA_JS)
+            return self._parse_structured_payloads(payloads['json_ld'], payloads['next_data'])
             
         except Exception as e:
             self.logger.debug(f"구조화된 데이터 추출 실패: {e}")
         
         return {}
     
+    def _extract_structured_data_from_html(self, content: bytes) -> Dict:
+        """정적 HTML에서 구조화된 데이터 추출 (브라우저 렌더링 없음)"""
+        tree = self._parse_html(content)
+        next_data = tree.css_first('script#__NEXT_DATA__')
+        return self._parse_structured_payloads(
+            [script.text() for script in tree.css('script[type="application/ld+json"]')],
+            next_data.text() if next_data else None
+        )
+    
+    def _parse_structured_payloads(self, json_ld: List[str], next_data: Optional[str]) -> Dict:
+        """JSON-LD 본문 목록과 __NEXT_DATA__ 본문에서 상품 정보 추출 (JSON-LD 우선)"""
+        for script_content in json_ld:
+            try:
+                data = orjson.loads(script_content)
+            except orjson.JSONDecodeError:
+                continue
+            
+            if isinstance(data, dict) and data.get('@type') == 'Product':
+                return self._parse_structured_product_data(data)
+            elif isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and item.get('@type') == 'Product':
+                        return self._parse_structured_product_data(item)
+        
+        # Next.js 앱의 초기 상태 데이터 확인
+        if next_data:
+            try:
+                return self._parse_next_data(orjson.loads(next_data))
+            except orjson.JSONDecodeError:
+                pass
+        
+        return {}
+    
     def _parse_structured_product_data(self, data: dict) -> Dict:
         """구조화된 상품 데이터 파싱"""
         parsed = {}
@@ -405,8 +561,12 @@ class SmartStoreCrawler(BaseCrawler):
                 offers = offers[0] if offers else {}
             
             if 'price' in offers:
-                price_text = str(offers['price'])
-                parsed['price'] = self._extract_price(price_text)
+                parsed['price'] = self._price_value(offers['price'])
+            
+            # 재고 상태 (schema.org availability)
+            status = self._availability_status(offers.get('availability'))
+            if status:
+                parsed['stock_status'] = status
             
             # 이미지
             if 'image' in data:
@@ -464,22 +624,43 @@ class SmartStoreCrawler(BaseCrawler):
                 parsed['product_name'] = product['name']
             
             if 'price' in product:
-                parsed['price'] = self._extract_price(str(product['price']))
+                parsed['price'] = self._price_value(product['price'])
             
             if 'imageUrl' in product or 'image' in product:
                 image = product.get('imageUrl') or product.get('image')
                 if image:
                     parsed['image_url'] = image
+            
+            # 재고 상태 (availability 문자열 우선, 없으면 품절 플래그)
+            status = self._availability_status(product.get('availability'))
+            if status is None:
+                for key in ('soldout', 'soldOut', 'isSoldOut'):
+                    if isinstance(product.get(key), bool):
+                        status = StockStatus.OUT_OF_STOCK if product[key] else StockStatus.AVAILABLE
+                        break
+            if status:
+                parsed['stock_status'] = status
                     
         except Exception:
             pass
         
         return parsed
     
+    @staticmethod
+    def _availability_status(availability: Any) -> Optional[StockStatus]:
+        """schema.org availability 값을 재고 상태로 변환 (매핑되지 않으면 None)"""
+        if not availability:
+            return None
+        availability = str(availability)
+        for keyword, status in _AVAILABILITY_STATUS:
+            if keyword in availability:
+                return status
+        return None
+    
     def _extract_discount_rate(self, discount_text: str) -> Optional[float]:
         """할인율 추출"""
         try:
-            rate_match = re.search(r'(\d+(?:\.\d+)?)%', discount_text)
+            rate_match = _DISCOUNT_RE.search(discount_text)
             if rate_match:
                 return float(rate_match.group(1))
         except (ValueError, AttributeError):
@@ -489,7 +670,7 @@ class SmartStoreCrawler(BaseCrawler):
     def _extract_rating(self, rating_text: str) -> Optional[float]:
         """평점 추출"""
         try:
-            rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
+            rating_match = _RATING_RE.search(rating_text)
             if rating_match:
                 rating = float(rating_match.group(1))
                 if 0 <= rating <= 5:
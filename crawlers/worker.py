@@ -6,32 +6,40 @@ tasks from Redis queues. Supports single worker mode and multi-process mode.
 """
 
 import argparse
-import asyncio
 import multiprocessing as mp
+from multiprocessing import connection as mp_connection
 import os
 import signal
 import sys
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from crawlers.core.queue_handler import QueueHandler, run_queue_handler
+from crawlers.core.queue_handler import QueueHandler, run_event_loop, run_queue_handler
 from config.settings import settings
-from storage.redis_client import redis_manager, task_queue
+from models.base import PlatformType
+from storage.redis_client import REFRESH_PRICE_ROLLUP_TASK, redis_manager, task_queue
 from utils.logging import get_logger
 
 
 class WorkerManager:
     """워커 프로세스들을 관리하는 매니저"""
     
-    def __init__(self, num_workers: int = 1, worker_prefix: str = "worker"):
+    def __init__(self, num_workers: int = 1, worker_prefix: str = "worker", num_processes: int = 1):
+        # num_workers: 프로세스당 동시 처리 작업 수 (한 이벤트 루프에서 세마포어로 제한)
+        # num_processes: 워커 프로세스 수 (프로세스마다 별도 Chrome 풀을 띄우므로 메모리 비용이 큼)
         self.num_workers = num_workers
+        self.num_processes = num_processes
         self.worker_prefix = worker_prefix
         self.logger = get_logger("worker_manager")
         self.processes: List[mp.Process] = []
         self.running = False
         self.start_time = time.time()
         
+        # 시그널 수신 시 _wait_for_workers의 대기를 깨우기 위한 파이프
+        self._wakeup_r, self._wakeup_w = mp.Pipe(duplex=False)
+        
         # 시그널 핸들러 등록
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -40,6 +48,7 @@ class WorkerManager:
         """시그널 핸들러 - Graceful shutdown"""
         self.logger.info(f"Received signal {signum}, shutting down workers...")
         self.running = False
+        self._wakeup_w.send_bytes(b"")
         
     def start(self):
         """워커 프로세스들을 시작"""
@@ -49,13 +58,16 @@ class WorkerManager:
             # Redis 연결 테스트
             self._test_redis_connection()
             
-            if self.num_workers == 1:
-                # 단일 워커 모드 (현재 프로세스에서 실행)
-                self.logger.info("Starting single worker mode")
+            if self.num_processes == 1:
+                # 단일 프로세스 모드 (현재 프로세스의 이벤트 루프에서 동시 처리)
+                self.logger.info(f"Starting single process worker (concurrency: {self.num_workers})")
                 self._run_single_worker()
             else:
                 # 멀티 프로세스 모드
-                self.logger.info(f"Starting {self.num_workers} worker processes")
+                self.logger.info(
+                    f"Starting {self.num_processes} worker processes "
+                    f"(concurrency per process: {self.num_workers})"
+                )
                 self._run_multi_workers()
                 
         except KeyboardInterrupt:
@@ -87,8 +99,8 @@ class WorkerManager:
         worker_id = f"{self.worker_prefix}-1"
         
         try:
-            # asyncio 이벤트 루프에서 실행
-            asyncio.run(run_queue_handler(worker_id))
+            # 이벤트 루프에서 실행 (uvloop 사용 가능 시 uvloop)
+            run_event_loop(run_queue_handler(worker_id, self.num_workers))
         except Exception as e:
             self.logger.error(f"Error in single worker: {e}")
             raise
@@ -96,7 +108,7 @@ class WorkerManager:
     def _run_multi_workers(self):
         """멀티 워커 실행"""
         # 워커 프로세스들 시작
-        for i in range(self.num_workers):
+        for i in range(self.num_processes):
             worker_id = f"{self.worker_prefix}-{i+1}"
             
             process = mp.Process(
@@ -120,8 +132,8 @@ class WorkerManager:
             logger = get_logger(f"worker.{worker_id}")
             logger.info(f"Worker process started: {worker_id} (PID: {os.getpid()})")
             
-            # asyncio 이벤트 루프에서 큐 핸들러 실행
-            asyncio.run(run_queue_handler(worker_id))
+            # 이벤트 루프에서 큐 핸들러 실행 (uvloop 사용 가능 시 uvloop)
+            run_event_loop(run_queue_handler(worker_id, self.num_workers))
             
         except KeyboardInterrupt:
             pass  # 부모 프로세스에서 처리
@@ -132,17 +144,18 @@ class WorkerManager:
     
     def _wait_for_workers(self):
         """워커 프로세스들의 완료를 대기"""
-        while self.running and any(p.is_alive() for p in self.processes):
-            # 정기적으로 상태 체크
-            alive_workers = [p for p in self.processes if p.is_alive()]
-            
-            if len(alive_workers) != len(self.processes):
-                # 일부 워커가 종료됨
-                dead_workers = [p for p in self.processes if not p.is_alive()]
-                for worker in dead_workers:
-                    self.logger.warning(f"Worker process died: {worker.name} (PID: {worker.pid})")
+        # 프로세스 sentinel은 종료 시 즉시 readable 상태가 되므로 폴링 없이 대기
+        owners = {p.sentinel: p for p in self.processes if p.is_alive()}
+        
+        while self.running and owners:
+            ready = mp_connection.wait(list(owners) + [self._wakeup_r], timeout=30)
             
-            time.sleep(5)  # 5초마다 체크
+            for sentinel in ready:
+                worker = owners.pop(sentinel, None)
+                if worker is not None:
+                    self.logger.warning(
+                        f"Worker process died: {worker.name} (PID: {worker.pid}, exitcode: {worker.exitcode})"
+                    )
         
         self.logger.info("All workers have stopped")
     
@@ -162,11 +175,19 @@ class WorkerManager:
                 except Exception as e:
                     self.logger.error(f"Error terminating process {process.name}: {e}")
         
-        # 프로세스들이 종료되기를 잠시 대기
-        time.sleep(2)
+        # 프로세스들이 종료되기를 최대 유예 시간만큼 대기 (모두 종료되면 즉시 진행)
+        pending = {p.sentinel: p for p in self.processes if p.is_alive()}
+        # 진행 중인 페이지 처리, 결과 플러시, 버퍼된 DB 저장이 끝날 시간을 줌
+        deadline = time.monotonic() + settings.crawler.shutdown_grace
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for sentinel in mp_connection.wait(list(pending), timeout=remaining):
+                pending.pop(sentinel, None)
         
         # 아직 살아있는 프로세스들을 강제 종료
-        for process in self.processes:
+        for process in pending.values():
             if process.is_alive():
                 try:
                     process.kill()
@@ -189,6 +210,28 @@ class WorkerManager:
         self.logger.info("Worker manager shutdown complete")
 
 
+@lru_cache(maxsize=None)
+def _tester_registry() -> Tuple[Dict[str, type], Dict[str, PlatformType]]:
+    """테스트용 플랫폼별 크롤러 클래스/플랫폼 매핑 (테스트 모드에서 처음 호출 시 한 번만 import)"""
+    from crawlers.platforms.coupang import CoupangCrawler
+    from crawlers.platforms.naver_shopping import NaverShoppingCrawler
+    from crawlers.platforms.smartstore import SmartStoreCrawler
+    
+    crawler_classes = {
+        'coupang': CoupangCrawler,
+        'naver_shopping': NaverShoppingCrawler,
+        'smartstore': SmartStoreCrawler,
+    }
+    
+    platform_enum = {
+        'coupang': PlatformType.COUPANG,
+        'naver_shopping': PlatformType.NAVER_SHOPPING,
+        'smartstore': PlatformType.SMART_STORE,
+    }
+    
+    return crawler_classes, platform_enum
+
+
 class SingleCrawlerTester:
     """개별 크롤러 테스트용 클래스"""
     
@@ -199,23 +242,7 @@ class SingleCrawlerTester:
     async def test_url(self, url: str, product_id: str = "test-product"):
         """특정 URL로 크롤러 테스트"""
         try:
-            from models.base import PlatformType
-            from crawlers.platforms.coupang import CoupangCrawler
-            from crawlers.platforms.naver_shopping import NaverShoppingCrawler
-            from crawlers.platforms.smartstore import SmartStoreCrawler
-            
-            # 플랫폼별 크롤러 매핑
-            crawler_classes = {
-                'coupang': CoupangCrawler,
-                'naver_shopping': NaverShoppingCrawler,
-                'smartstore': SmartStoreCrawler,
-            }
-            
-            platform_enum = {
-                'coupang': PlatformType.COUPANG,
-                'naver_shopping': PlatformType.NAVER_SHOPPING,
-                'smartstore': PlatformType.SMART_STORE,
-            }
+            crawler_classes, platform_enum = _tester_registry()
             
             if self.platform not in crawler_classes:
                 raise ValueError(f"Unsupported platform: {self.platform}")
@@ -255,14 +282,23 @@ def create_argument_parser():
         epilog="""
 Examples:
   %(prog)s                          # 단일 워커 실행
-  %(prog)s --workers 4              # 4개 워커 프로세스 실행
+  %(prog)s --workers 4              # 한 프로세스에서 4개 작업 동시 처리
+  %(prog)s --workers 4 --processes 2  # 2개 프로세스 x 4개 동시 작업
   %(prog)s --test coupang --url "https://..."  # 쿠팡 크롤러 테스트
+  %(prog)s --refresh-rollup         # 일간 가격 집계 갱신 작업 추가 (cron에서 매일 실행)
         """
     )
     
     parser.add_argument(
         '--workers', '-w',
         type=int,
+        default=settings.crawler.task_concurrency,
+        help=f'Number of concurrent tasks per process (default: {settings.crawler.task_concurrency})'
+    )
+    
+    parser.add_argument(
+        '--processes', '-p',
+        type=int,
         default=1,
         help='Number of worker processes (default: 1)'
     )
@@ -294,6 +330,12 @@ Examples:
         help='Product ID for testing (default: test-product)'
     )
     
+    parser.add_argument(
+        '--refresh-rollup',
+        action='store_true',
+        help='Enqueue a price_daily_rollup refresh task and exit (for cron)'
+    )
+    
     parser.add_argument(
         '--log-level',
         type=str,
@@ -315,13 +357,18 @@ def main():
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
     try:
+        if args.refresh_rollup:
+            # 일간 가격 집계 갱신 작업만 큐에 추가 (워커가 처리)
+            redis_manager.initialize()
+            sys.exit(0 if task_queue.push_maintenance_task(REFRESH_PRICE_ROLLUP_TASK) else 1)
+        
         if args.test:
             # 테스트 모드
             if not args.url:
                 parser.error("--url is required when using --test")
             
             tester = SingleCrawlerTester(args.test)
-            result = asyncio.run(tester.test_url(args.url, args.product_id))
+            result = run_event_loop(tester.test_url(args.url, args.product_id))
             
             sys.exit(0 if result.success else 1)
         
@@ -329,10 +376,13 @@ def main():
             # 일반 워커 모드
             if args.workers < 1:
                 parser.error("Number of workers must be at least 1")
+            if args.processes < 1:
+                parser.error("Number of processes must be at least 1")
             
             manager = WorkerManager(
                 num_workers=args.workers,
-                worker_prefix=args.worker_prefix
+                worker_prefix=args.worker_prefix,
+                num_processes=args.processes
             )
             
             manager.start()
@@ -5,9 +5,8 @@ Base model classes and enums for the Price Sense crawler system.
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DDL, DateTime, String, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column
@@ -47,6 +46,13 @@ class StockStatus(str, Enum):
 
 Base = declarative_base()
 
+# gen_random_uuid()는 PostgreSQL 13 미만에서 pgcrypto 확장이 필요 (스키마 생성 시 한 번만 실행)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pgcrypto").execute_if(dialect="postgresql")
+)
+
 
 class BaseModel:
     """공통 기본 모델 믹스인"""
@@ -54,7 +60,7 @@ class BaseModel:
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), 
         primary_key=True, 
-        default=lambda: str(uuid4())
+        server_default=text("gen_random_uuid()")
     )
     
     created_at: Mapped[datetime] = mapped_column(
@@ -6,7 +6,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, DECIMAL, Text
+from sqlalchemy import (
+    DDL, Column, DateTime, ForeignKey, Index, Integer, MetaData, DECIMAL, Table, Text, event, text
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,7 +23,7 @@ class PriceHistory(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), 
         primary_key=True, 
-        default=lambda: str(__import__('uuid').uuid4())
+        server_default=text("gen_random_uuid()")
     )
     
     product_id: Mapped[str] = mapped_column(
@@ -53,11 +55,80 @@ class PriceHistory(Base):
     
     # 인덱스
     __table_args__ = (
-        Index('idx_price_history_product_id', 'product_id'),
-        Index('idx_price_history_recorded_at', 'recorded_at'),
+        # 추가 순서대로 쌓이는 시계열 컬럼은 BRIN (B-tree 대비 크기/쓰기 비용이 매우 작음)
+        Index('idx_price_history_recorded_at_brin', 'recorded_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('idx_price_history_product_recorded', 'product_id', 'recorded_at'),
         Index('idx_price_history_confidence', 'confidence_score'),
     )
     
     def __repr__(self) -> str:
-        return f"<PriceHistory(product_id={self.product_id}, price={self.price}, recorded_at={self.recorded_at})>"
\ No newline at end of file
+        return f"<PriceHistory(product_id={self.product_id}, price={self.price}, recorded_at={self.recorded_at})>"
+
+
+# 최신 가격을 products에 비정규화 (조회 시 price_history 최신 행 조인 불필요)
+event.listen(
+    PriceHistory.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION sync_product_price() RETURNS trigger AS $$
+        BEGIN
+            UPDATE products SET
+                price_last_changed_at = CASE
+                    WHEN current_price IS DISTINCT FROM NEW.price THEN NEW.recorded_at
+                    ELSE price_last_changed_at
+                END,
+                current_price = NEW.price,
+                last_scraped_at = NEW.recorded_at
+            WHERE id = NEW.product_id
+              -- 재시도/재적재로 늦게 들어온 과거 행이 최신 상태를 되돌리지 않도록
+              AND (last_scraped_at IS NULL OR NEW.recorded_at >= last_scraped_at);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER trg_price_history_sync_product
+            AFTER INSERT ON price_history
+            FOR EACH ROW EXECUTE FUNCTION sync_product_price();
+    """).execute_if(dialect="postgresql")
+)
+
+
+# 상품별 일간 가격 집계 (분석 조회용 materialized view, REFRESH ... CONCURRENTLY로 갱신)
+PRICE_DAILY_ROLLUP = "price_daily_rollup"
+
+# 신규 DB는 after_create로, 기존 DB는 갱신 작업에서 같은 DDL로 생성 (모두 IF NOT EXISTS)
+PRICE_DAILY_ROLLUP_DDL = f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS {PRICE_DAILY_ROLLUP} AS
+        SELECT
+            product_id,
+            date_trunc('day', recorded_at) AS day,
+            min(price) AS min_price,
+            max(price) AS max_price,
+            avg(price) AS avg_price,
+            count(*) AS sample_count
+        FROM price_history
+        GROUP BY 1, 2;
+
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_{PRICE_DAILY_ROLLUP}_product_day
+            ON {PRICE_DAILY_ROLLUP} (product_id, day);
+    """
+
+event.listen(
+    PriceHistory.__table__,
+    "after_create",
+    DDL(PRICE_DAILY_ROLLUP_DDL).execute_if(dialect="postgresql")
+)
+
+# 조회 전용 테이블 정의 (별도 MetaData라 create_all 대상에서 제외)
+price_daily_rollup = Table(
+    PRICE_DAILY_ROLLUP,
+    MetaData(),
+    Column("product_id", UUID(as_uuid=False), primary_key=True),
+    Column("day", DateTime(timezone=True), primary_key=True),
+    Column("min_price", DECIMAL(12, 2)),
+    Column("max_price", DECIMAL(12, 2)),
+    Column("avg_price", DECIMAL),
+    Column("sample_count", Integer),
+    info={"is_view": True}
+)
@@ -1,5 +1,13 @@
 """
 Product model for the Price Sense crawler system.
+
+JSONB 컬럼은 문서 전체가 아니라 실제로 조회하는 키에만 표현식 인덱스를 둔다.
+지원하는 조회 형태 (새 조회가 필요하면 아래 목록과 인덱스를 함께 추가):
+
+- Product.stock_signal('source') == 'api'                   -> idx_products_signal_source
+- Product.stock_signal('low_stock', Boolean).is_(True)      -> idx_products_signal_low_stock
+- Product.stock_signal('last_seen_price', Numeric) < 10000  -> idx_products_signal_last_seen_price
+- Product.seller_id() == '...'                              -> idx_products_seller_id
 """
 
 from datetime import datetime
@@ -8,7 +16,7 @@ from typing import List, Optional
 
 from sqlalchemy import (
     Boolean, DateTime, ForeignKey, Index, Integer, 
-    DECIMAL, String, Text, UniqueConstraint
+    DECIMAL, String, Text, UniqueConstraint, text
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -39,6 +47,8 @@ class Product(Base, BaseModel):
     custom_name: Mapped[Optional[str]] = mapped_column(String(500))
     current_price: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(12, 2))
     original_price: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(12, 2))
+    # 가격이 마지막으로 바뀐 시각 (price_history 트리거가 current_price와 함께 갱신)
+    price_last_changed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     currency: Mapped[str] = mapped_column(String(3), default="KRW")
     
     # 재고 신호 정보
@@ -81,10 +91,15 @@ class Product(Base, BaseModel):
     # 사용자 노트
     notes: Mapped[Optional[str]] = mapped_column(Text)
     
-    # 관계 설정
-    price_history = relationship("PriceHistory", back_populates="product")
-    stock_history = relationship("StockHistory", back_populates="product")
-    scrape_logs = relationship("ProductScrapeLog", back_populates="product")
+    # 관계 설정 (이력 테이블은 계속 쌓이므로 지연 로딩 금지, 필요 시 selectinload로 명시 로딩)
+    price_history = relationship("PriceHistory", back_populates="product", lazy="raise")
+    stock_history = relationship("StockHistory", back_populates="product", lazy="raise")
+    scrape_logs = relationship(
+        "ProductScrapeLog",
+        back_populates="product",
+        lazy="raise",
+        order_by="desc(ProductScrapeLog.created_at)"
+    )
     
     # 제약 조건
     __table_args__ = (
@@ -100,8 +115,22 @@ class Product(Base, BaseModel):
         Index('idx_products_created_at', 'created_at'),
         Index('idx_products_updated_at', 'updated_at'),
         Index('idx_products_last_scraped_at', 'last_scraped_at'),
+        Index('idx_products_price_last_changed_at', 'price_last_changed_at'),
+        # JSONB 키별 표현식 인덱스 (전체 문서 GIN 대비 크기/쓰기 비용이 작음)
+        Index('idx_products_signal_source', text("(stock_signals->>'source')")),
+        Index('idx_products_seller_id', text("(seller_info->>'seller_id')")),
     )
     
+    @classmethod
+    def stock_signal(cls, key: str):
+        """재고 신호 키 조회 표현식 (->> 텍스트, 인덱스 표현식과 같은 형태)"""
+        return cls.stock_signals[key].astext
+    
+    @classmethod
+    def seller_id(cls):
+        """판매자 ID 조회 표현식"""
+        return cls.seller_info['seller_id'].astext
+    
     def __repr__(self) -> str:
         return f"<Product(id={self.id}, name={self.name[:50]}, platform={self.platform})>"
 
@@ -5,7 +5,7 @@ Scrape logs model for tracking crawler execution results.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,7 +20,7 @@ class ProductScrapeLog(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), 
         primary_key=True, 
-        default=lambda: str(__import__('uuid').uuid4())
+        server_default=text("gen_random_uuid()")
     )
     
     product_id: Mapped[str] = mapped_column(
@@ -59,9 +59,10 @@ class ProductScrapeLog(Base):
     
     # 인덱스
     __table_args__ = (
-        Index('idx_scrape_logs_product_id', 'product_id'),
         Index('idx_scrape_logs_status', 'status'),
-        Index('idx_scrape_logs_created_at', 'created_at'),
+        # 로그 생성 시각 범위 조회용 BRIN
+        Index('idx_scrape_logs_created_at_brin', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('idx_scrape_logs_product_status', 'product_id', 'status'),
     )
     
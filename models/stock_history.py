@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, DECIMAL
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Integer, DECIMAL, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,7 +21,7 @@ class StockHistory(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), 
         primary_key=True, 
-        default=lambda: str(__import__('uuid').uuid4())
+        server_default=text("gen_random_uuid()")
     )
     
     product_id: Mapped[str] = mapped_column(
@@ -52,12 +52,37 @@ class StockHistory(Base):
     
     # 인덱스
     __table_args__ = (
-        Index('idx_stock_history_product_id', 'product_id'),
-        Index('idx_stock_history_recorded_at', 'recorded_at'),
+        # 시간순으로만 추가되므로 BRIN 사용
+        Index('idx_stock_history_recorded_at_brin', 'recorded_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('idx_stock_history_product_recorded', 'product_id', 'recorded_at'),
         Index('idx_stock_history_status', 'stock_status'),
         Index('idx_stock_history_confidence', 'confidence_score'),
     )
     
     def __repr__(self) -> str:
-        return f"<StockHistory(product_id={self.product_id}, status={self.stock_status}, recorded_at={self.recorded_at})>"
\ No newline at end of file
+        return f"<StockHistory(product_id={self.product_id}, status={self.stock_status}, recorded_at={self.recorded_at})>"
+
+
+# 최신 재고 상태를 products에 비정규화 (조회 시 stock_history 최신 행 조인 불필요)
+event.listen(
+    StockHistory.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION sync_product_stock() RETURNS trigger AS $$
+        BEGIN
+            UPDATE products SET
+                stock_status = NEW.stock_status,
+                last_scraped_at = NEW.recorded_at
+            WHERE id = NEW.product_id
+              -- 재시도/재적재로 늦게 들어온 과거 행이 최신 상태를 되돌리지 않도록
+              AND (last_scraped_at IS NULL OR NEW.recorded_at >= last_scraped_at);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER trg_stock_history_sync_product
+            AFTER INSERT ON stock_history
+            FOR EACH ROW EXECUTE FUNCTION sync_product_stock();
+    """).execute_if(dialect="postgresql")
+)
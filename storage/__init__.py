@@ -4,10 +4,12 @@ Storage package for database and Redis connections.
 
 from .connection import (
     db_manager,
+    bulk_insert,
     get_db_session,
     get_async_db_session,
     init_db,
-    close_db
+    close_db,
+    refresh_price_daily_rollup
 )
 from .redis_client import (
     redis_manager,
@@ -19,10 +21,12 @@ from .redis_client import (
 
 __all__ = [
     "db_manager",
+    "bulk_insert",
     "get_db_session", 
     "get_async_db_session",
     "init_db",
     "close_db",
+    "refresh_price_daily_rollup",
     "redis_manager",
     "task_queue",
     "cache_manager", 
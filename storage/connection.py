@@ -3,10 +3,12 @@ Database connection management for Price Sense crawler system.
 """
 
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, ContextManager, Dict, Generator, Sequence
 import logging
+import threading
 
-from sqlalchemy import create_engine, event
+import orjson
+from sqlalchemy import Table, create_engine, event, insert, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import (
     AsyncSession, 
@@ -17,10 +19,16 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from config.settings import settings
+from models.price_history import PRICE_DAILY_ROLLUP, PRICE_DAILY_ROLLUP_DDL
 
 logger = logging.getLogger(__name__)
 
 
+def _json_serializer(obj: Any) -> str:
+    """JSON/JSONB 컬럼 직렬화 (orjson)"""
+    return orjson.dumps(obj).decode()
+
+
 class DatabaseManager:
     """데이터베이스 연결 관리자"""
     
@@ -30,59 +38,73 @@ class DatabaseManager:
         self._session_factory: sessionmaker = None
         self._async_session_factory = None
         self._initialized = False
+        self._init_lock = threading.Lock()
     
     def initialize(self) -> None:
         """데이터베이스 연결 초기화"""
         if self._initialized:
             return
+        
+        # 여러 스레드(to_thread 저장 작업 등)가 동시에 첫 접근해도 엔진/풀은 한 번만 생성
+        with self._init_lock:
+            if self._initialized:
+                return
             
-        try:
-            # 동기 엔진 생성
-            self._engine = create_engine(
-                settings.database.url,
-                pool_size=settings.database.pool_size,
-                max_overflow=settings.database.max_overflow,
-                pool_timeout=settings.database.pool_timeout,
-                pool_recycle=settings.database.pool_recycle,
-                pool_pre_ping=True,  # 연결 상태 확인
-                poolclass=QueuePool,
-                echo=settings.database.echo
-            )
-            
-            # 비동기 엔진 생성 (향후 확장용)
-            async_url = settings.database.url.replace("postgresql://", "postgresql+asyncpg://")
-            self._async_engine = create_async_engine(
-                async_url,
-                pool_size=settings.database.pool_size,
-                max_overflow=settings.database.max_overflow,
-                pool_timeout=settings.database.pool_timeout,
-                pool_recycle=settings.database.pool_recycle,
-                echo=settings.database.echo
-            )
-            
-            # 세션 팩토리 생성
-            self._session_factory = sessionmaker(
-                bind=self._engine,
-                autocommit=False,
-                autoflush=False
-            )
-            
-            self._async_session_factory = async_sessionmaker(
-                bind=self._async_engine,
-                class_=AsyncSession,
-                autocommit=False,
-                autoflush=False
-            )
-            
-            # 엔진 이벤트 리스너 등록
-            self._register_event_listeners()
-            
-            self._initialized = True
-            logger.info("Database connection initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize database connection: {e}")
-            raise
+            try:
+                # 동기 엔진 생성
+                self._engine = create_engine(
+                    settings.database.url,
+                    pool_size=settings.database.pool_size,
+                    max_overflow=settings.database.max_overflow,
+                    pool_timeout=settings.database.pool_timeout,
+                    pool_recycle=settings.database.pool_recycle,
+                    pool_pre_ping=True,  # 연결 상태 확인
+                    poolclass=QueuePool,
+                    echo=settings.database.echo,
+                    json_serializer=_json_serializer,
+                    json_deserializer=orjson.loads,
+                    insertmanyvalues_page_size=settings.database.insert_page_size
+                )
+                
+                # 비동기 엔진 생성 (향후 확장용)
+                # psycopg 3 비동기 드라이버 (prepare_threshold: 반복 실행되는 문장은 서버 측 prepared statement로)
+                async_url = settings.database.url.replace("postgresql://", "postgresql+psycopg://")
+                self._async_engine = create_async_engine(
+                    async_url,
+                    connect_args={"prepare_threshold": 5},
+                    pool_size=settings.database.pool_size,
+                    max_overflow=settings.database.max_overflow,
+                    pool_timeout=settings.database.pool_timeout,
+                    pool_recycle=settings.database.pool_recycle,
+                    echo=settings.database.echo,
+                    json_serializer=_json_serializer,
+                    json_deserializer=orjson.loads,
+                    insertmanyvalues_page_size=settings.database.insert_page_size
+                )
+                
+                # 세션 팩토리 생성
+                self._session_factory = sessionmaker(
+                    bind=self._engine,
+                    autocommit=False,
+                    autoflush=False
+                )
+                
+                self._async_session_factory = async_sessionmaker(
+                    bind=self._async_engine,
+                    class_=AsyncSession,
+                    autocommit=False,
+                    autoflush=False
+                )
+                
+                # 엔진 이벤트 리스너 등록
+                self._register_event_listeners()
+                
+                self._initialized = True
+                logger.info("Database connection initialized successfully")
+                
+            except Exception as e:
+                logger.error(f"Failed to initialize database connection: {e}")
+                raise
     
     def _register_event_listeners(self) -> None:
         """SQLAlchemy 이벤트 리스너 등록"""
@@ -122,6 +144,12 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def transaction(self) -> ContextManager[Session]:
+        """세션 + 트랜잭션 컨텍스트 (정상 종료 시 커밋, 예외 시 롤백 후 세션 종료)"""
+        if not self._initialized:
+            self.initialize()
+        return self._session_factory.begin()
+    
     @asynccontextmanager
     async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
         """비동기 데이터베이스 세션 컨텍스트 매니저"""
@@ -152,10 +180,10 @@ class DatabaseManager:
         return self._async_engine
     
     def check_connection(self) -> bool:
-        """데이터베이스 연결 상태 확인"""
+        """데이터베이스 연결 상태 확인 (시작 시/헬스체크용, 요청마다 호출하지 말 것 - 풀에서 pool_pre_ping으로 확인)"""
         try:
-            with self.get_session() as session:
-                session.execute("SELECT 1")
+            with self.get_engine().connect() as conn:
+                conn.exec_driver_sql("SELECT 1")
             return True
         except Exception as e:
             logger.error(f"Database connection check failed: {e}")
@@ -185,6 +213,23 @@ db_manager = DatabaseManager()
 
 
 # 편의 함수들
+def bulk_insert(session: Session, table: Table, rows: Sequence[Dict[str, Any]]) -> None:
+    """여러 행을 Core insert로 저장 (insertmanyvalues로 다중 행 INSERT 문에 묶어 전송)"""
+    if rows:
+        session.execute(insert(table), rows)
+
+
+def refresh_price_daily_rollup() -> None:
+    """일간 가격 집계 materialized view 갱신 (조회를 막지 않도록 CONCURRENTLY)"""
+    # 전체 price_history를 다시 집계하므로 연결 기본값(30초) 대신 전용 타임아웃 적용 (0이면 제한 없음)
+    timeout_ms = int(settings.database.rollup_refresh_timeout * 1000)
+    with db_manager.transaction() as session:
+        session.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+        # after_create 이전에 만들어진 DB에도 뷰/유니크 인덱스가 있도록 보장 (이미 있으면 무시)
+        session.execute(text(PRICE_DAILY_ROLLUP_DDL))
+        session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {PRICE_DAILY_ROLLUP}"))
+
+
 def get_db_session() -> Generator[Session, None, None]:
     """데이터베이스 세션 획득 (동기)"""
     return db_manager.get_session()
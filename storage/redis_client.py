@@ -2,20 +2,40 @@
 Redis connection and queue management for Price Sense crawler system.
 """
 
-import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
 from contextlib import asynccontextmanager, contextmanager
 
+import orjson
 import redis
 from redis import ConnectionPool, Redis
+from redis import asyncio as aioredis
 from redis.exceptions import ConnectionError, TimeoutError, RedisError
 
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# 파이프라인 명령: (명령어, 키, 값)
+QueueOp = Tuple[str, str, bytes]
+
+# 플랫폼 없이 task_type으로 처리되는 유지보수 작업
+REFRESH_PRICE_ROLLUP_TASK = "refresh_price_rollup"
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson이 기본 지원하지 않는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(data: Any) -> bytes:
+    """큐/캐시 페이로드 직렬화 (orjson, UTF-8 bytes)"""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
 
 class RedisManager:
     """Redis 연결 및 큐 관리자"""
@@ -23,6 +43,8 @@ class RedisManager:
     def __init__(self):
         self._pool: ConnectionPool = None
         self._client: Redis = None
+        self._async_pool: Optional[aioredis.BlockingConnectionPool] = None
+        self._async_client: Optional[aioredis.Redis] = None
         self._initialized = False
     
     def initialize(self) -> None:
@@ -45,6 +67,18 @@ class RedisManager:
             # Redis 클라이언트 생성
             self._client = Redis(connection_pool=self._pool)
             
+            # 비동기 클라이언트용 연결 풀 (연결이 모두 사용 중이면 반환될 때까지 대기)
+            self._async_pool = aioredis.BlockingConnectionPool.from_url(
+                settings.redis.url,
+                max_connections=settings.redis.max_connections,
+                socket_timeout=settings.redis.socket_timeout,
+                socket_connect_timeout=settings.redis.socket_connect_timeout,
+                socket_keepalive=True,
+                retry_on_timeout=settings.redis.retry_on_timeout,
+                health_check_interval=settings.redis.health_check_interval,
+                decode_responses=True
+            )
+            
             # 연결 테스트
             self._client.ping()
             
@@ -70,6 +104,15 @@ class RedisManager:
             logger.error(f"Redis operation error: {e}")
             raise
     
+    def get_async_client(self) -> aioredis.Redis:
+        """공유 비동기 Redis 클라이언트 반환"""
+        if not self._initialized:
+            self.initialize()
+        
+        if self._async_client is None:
+            self._async_client = aioredis.Redis(connection_pool=self._async_pool)
+        return self._async_client
+    
     def check_connection(self) -> bool:
         """Redis 연결 상태 확인"""
         try:
@@ -86,6 +129,16 @@ class RedisManager:
             self._client.connection_pool.disconnect()
             logger.info("Redis connection closed")
         self._initialized = False
+    
+    async def aclose(self) -> None:
+        """비동기 Redis 연결 종료"""
+        if self._async_client:
+            await self._async_client.aclose()
+            self._async_client = None
+        
+        if self._async_pool:
+            await self._async_pool.disconnect()
+            logger.info("Async Redis connection closed")
 
 
 class TaskQueue:
@@ -96,33 +149,39 @@ class TaskQueue:
         self.crawl_queue = settings.redis.crawl_queue_name
         self.result_queue = settings.redis.result_queue_name
         self.dead_letter_queue = settings.redis.dead_letter_queue
+        self.failed_save_queue = settings.redis.failed_save_queue
+    
+    def task_op(self, task_data: Dict[str, Any], priority: str = "normal") -> QueueOp:
+        """작업 추가 명령 생성"""
+        # 작업 데이터에 메타데이터 추가
+        task_data.update({
+            "created_at": datetime.utcnow().isoformat(),
+            "priority": priority,
+            "retry_count": task_data.get("retry_count", 0)
+        })
+        
+        task_json = _dumps(task_data)
+        
+        # 우선순위에 따라 큐 선택, LPUSH로 큐에 추가
+        return ("lpush", f"{self.crawl_queue}:{priority}", task_json)
     
     def push_task(self, task_data: Dict[str, Any], priority: str = "normal") -> bool:
         """크롤링 작업을 큐에 추가"""
         try:
-            with self.redis_manager.get_client() as client:
-                # 작업 데이터에 메타데이터 추가
-                task_data.update({
-                    "created_at": datetime.utcnow().isoformat(),
-                    "priority": priority,
-                    "retry_count": task_data.get("retry_count", 0)
-                })
-                
-                task_json = json.dumps(task_data, ensure_ascii=False)
-                
-                # 우선순위에 따라 큐 선택
-                queue_name = f"{self.crawl_queue}:{priority}"
-                
-                # LPUSH로 큐에 추가 (LIFO)
-                client.lpush(queue_name, task_json)
-                
+            success = self.push_batch([self.task_op(task_data, priority)])
+            if success:
                 logger.info(f"Task added to queue: {task_data.get('task_id', 'unknown')}")
-                return True
+            return success
                 
         except Exception as e:
             logger.error(f"Failed to push task to queue: {e}")
             return False
     
+    def push_maintenance_task(self, task_type: str) -> bool:
+        """유지보수 작업(예: 일간 가격 집계 갱신)을 크롤링 큐에 추가"""
+        task_id = f"{task_type}:{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+        return self.push_task({"task_id": task_id, "task_type": task_type})
+    
     def pop_task(self, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """큐에서 작업을 가져옴 (블로킹)"""
         try:
@@ -138,7 +197,7 @@ class TaskQueue:
                 
                 if result:
                     queue_name, task_json = result
-                    task_data = json.loads(task_json)
+                    task_data = orjson.loads(task_json)
                     logger.debug(f"Task popped from queue: {task_data.get('task_id', 'unknown')}")
                     return task_data
                 
@@ -148,54 +207,145 @@ class TaskQueue:
             logger.error(f"Failed to pop task from queue: {e}")
             return None
     
+    async def brpop_task_async(
+        self, client: aioredis.Redis, timeout: int = 10
+    ) -> Optional[Tuple[str, str]]:
+        """첫 작업을 BRPOP으로 대기 (비동기, 높은 우선순위부터) -> (큐 이름, 작업 JSON)"""
+        try:
+            result = await client.brpop(
+                [f"{self.crawl_queue}:high", f"{self.crawl_queue}:normal"],
+                timeout=timeout
+            )
+            return tuple(result) if result else None
+            
+        except Exception as e:
+            logger.error(f"Failed to pop tasks from queue: {e}")
+            return None
+    
+    async def rpop_tasks_async(self, client: aioredis.Redis, queue_name: str, count: int) -> List[str]:
+        """같은 큐에 쌓인 작업을 RPOP COUNT로 한 번에 가져옴 (비동기, 작업 JSON 목록)"""
+        try:
+            return await client.rpop(queue_name, count) or []
+            
+        except Exception as e:
+            logger.error(f"Failed to pop tasks from queue: {e}")
+            return []
+    
+    def requeue_ops(self, queue_name: str, task_jsons: List[str]) -> List[QueueOp]:
+        """꺼낸 작업을 원래 순서대로 큐의 꺼내는 쪽 끝에 되돌리는 명령 생성"""
+        return [("rpush", queue_name, task_json) for task_json in reversed(task_jsons)]
+    
+    def result_op(self, result_data: Dict[str, Any]) -> QueueOp:
+        """결과 추가 명령 생성"""
+        result_data["completed_at"] = datetime.utcnow().isoformat()
+        result_json = _dumps(result_data)
+        return ("lpush", self.result_queue, result_json)
+    
     def push_result(self, result_data: Dict[str, Any]) -> bool:
         """크롤링 결과를 결과 큐에 추가"""
         try:
-            with self.redis_manager.get_client() as client:
-                result_data["completed_at"] = datetime.utcnow().isoformat()
-                result_json = json.dumps(result_data, ensure_ascii=False)
-                
-                client.lpush(self.result_queue, result_json)
-                
+            success = self.push_batch([self.result_op(result_data)])
+            if success:
                 logger.info(f"Result added to queue: {result_data.get('task_id', 'unknown')}")
-                return True
+            return success
                 
         except Exception as e:
             logger.error(f"Failed to push result to queue: {e}")
             return False
     
+    def _result_payloads(self, results: List[Dict[str, Any]]) -> List[bytes]:
+        """결과 목록을 큐 페이로드로 직렬화"""
+        completed_at = datetime.utcnow().isoformat()
+        payloads = []
+        for result_data in results:
+            result_data["completed_at"] = completed_at
+            payloads.append(_dumps(result_data))
+        return payloads
+    
+    async def push_results_async(self, client: aioredis.Redis, results: List[Dict[str, Any]]) -> bool:
+        """여러 결과를 한 번의 LPUSH로 결과 큐에 추가 (비동기)"""
+        if not results:
+            return True
+        
+        try:
+            await client.lpush(self.result_queue, *self._result_payloads(results))
+            
+            logger.info(f"{len(results)} results added to queue")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to push results to queue: {e}")
+            return False
+    
+    def failed_task_op(self, task_data: Dict[str, Any], error: str) -> QueueOp:
+        """실패 작업의 재시도 또는 데드레터 큐 이동 명령 생성"""
+        retry_count = task_data.get("retry_count", 0)
+        max_retries = settings.crawler.max_retries
+        
+        if retry_count < max_retries:
+            # 재시도
+            task_data["retry_count"] = retry_count + 1
+            task_data["last_error"] = error
+            task_data["retry_at"] = datetime.utcnow().isoformat()
+            
+            return self.task_op(task_data, task_data.get("priority", "normal"))
+        
+        # 데드레터 큐로 이동
+        task_data.update({
+            "final_error": error,
+            "failed_at": datetime.utcnow().isoformat(),
+            "retry_count": retry_count
+        })
+        
+        failed_json = _dumps(task_data)
+        logger.warning(f"Task moved to dead letter queue: {task_data.get('task_id', 'unknown')}")
+        return ("lpush", self.dead_letter_queue, failed_json)
+    
     def push_failed_task(self, task_data: Dict[str, Any], error: str) -> bool:
         """실패한 작업을 재시도하거나 데드레터 큐로 이동"""
         try:
-            retry_count = task_data.get("retry_count", 0)
-            max_retries = settings.crawler.max_retries
-            
-            if retry_count < max_retries:
-                # 재시도
-                task_data["retry_count"] = retry_count + 1
-                task_data["last_error"] = error
-                task_data["retry_at"] = datetime.utcnow().isoformat()
-                
-                return self.push_task(task_data, task_data.get("priority", "normal"))
-            else:
-                # 데드레터 큐로 이동
-                with self.redis_manager.get_client() as client:
-                    task_data.update({
-                        "final_error": error,
-                        "failed_at": datetime.utcnow().isoformat(),
-                        "retry_count": retry_count
-                    })
-                    
-                    failed_json = json.dumps(task_data, ensure_ascii=False)
-                    client.lpush(self.dead_letter_queue, failed_json)
-                    
-                    logger.warning(f"Task moved to dead letter queue: {task_data.get('task_id', 'unknown')}")
-                    return True
+            return self.push_batch([self.failed_task_op(task_data, error)])
                     
         except Exception as e:
             logger.error(f"Failed to handle failed task: {e}")
             return False
     
+    def failed_save_op(self, rows: Dict[str, List[Dict[str, Any]]], error: str) -> QueueOp:
+        """DB 저장에 실패한 행을 저장 실패 큐로 옮기는 명령 생성 (수동 재적재용)"""
+        failed_json = _dumps({
+            **rows,
+            "error": error,
+            "failed_at": datetime.utcnow().isoformat()
+        })
+        return ("lpush", self.failed_save_queue, failed_json)
+    
+    def push_batch(self, ops: List[QueueOp]) -> bool:
+        """여러 큐 명령을 하나의 파이프라인으로 전송 (1회 왕복)"""
+        try:
+            with self.redis_manager.get_client() as client:
+                pipe = client.pipeline(transaction=False)
+                for command, key, value in ops:
+                    getattr(pipe, command)(key, value)
+                pipe.execute()
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to push batch to queue: {e}")
+            return False
+    
+    async def push_batch_async(self, client: aioredis.Redis, ops: List[QueueOp]) -> bool:
+        """여러 큐 명령을 하나의 파이프라인으로 전송 (비동기)"""
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for command, key, value in ops:
+                    getattr(pipe, command)(key, value)
+                await pipe.execute()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to push batch to queue: {e}")
+            return False
+    
     def get_queue_stats(self) -> Dict[str, int]:
         """큐 통계 정보 조회"""
         try:
@@ -249,7 +399,7 @@ class CacheManager:
         try:
             with self.redis_manager.get_client() as client:
                 if isinstance(value, (dict, list)):
-                    value = json.dumps(value, ensure_ascii=False)
+                    value = _dumps(value)
                 
                 ttl = ttl or self.default_ttl
                 client.setex(key, ttl, value)
@@ -259,6 +409,32 @@ class CacheManager:
             logger.error(f"Failed to set cache: {e}")
             return False
     
+    async def get_async(self, key: str) -> Optional[str]:
+        """캐시 원본 문자열 조회 (공유 비동기 클라이언트)"""
+        try:
+            return await self.redis_manager.get_async_client().get(key)
+            
+        except Exception as e:
+            logger.error(f"Failed to get cache: {e}")
+            return None
+    
+    async def set_many_async(self, items: Dict[str, str], ttl: Optional[int] = None) -> bool:
+        """여러 문자열 값을 한 번의 파이프라인으로 설정 (SET EX, 공유 비동기 클라이언트)"""
+        if not items:
+            return True
+        
+        try:
+            ttl = ttl or self.default_ttl
+            async with self.redis_manager.get_async_client().pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, ex=ttl)
+                await pipe.execute()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to set cache: {e}")
+            return False
+    
     def get(self, key: str) -> Optional[Any]:
         """캐시 값 조회"""
         try:
@@ -269,8 +445,8 @@ class CacheManager:
                 
                 # JSON 파싱 시도
                 try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
                     return value
                     
         except Exception as e:
@@ -210,6 +210,44 @@ class RequestDelayManager:
         return delay
 
 
+class TokenBucketLimiter:
+    """토큰 버킷 기반 비동기 요청 속도 제한 (지터 포함)"""
+    
+    def __init__(self, rate: float, capacity: float = 1.0, jitter: float = 0.1):
+        self.rate = rate  # 초당 토큰 충전량
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            
+            # 부족한 토큰이 충전될 때까지 대기 (락을 잡은 채 대기하여 순서 보장)
+            delay = (1 - self._tokens) / self.rate
+            delay += random.uniform(0, delay * self.jitter)
+            await asyncio.sleep(delay)
+            
+            self._tokens = 0
+            self._updated_at = time.monotonic()
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
 class ChromeOptionsEnhancer:
     """Chrome 옵션 강화 (탐지 방지)"""
     